@@ -26,6 +26,11 @@ from .uitest import (
     assert_about_opens,
     assert_about_computer_opens,
     run_tests,
+    run_tests_parallel,
+    wait_until,
+    readonly,
+    READONLY,
+    cacheable_smoke,
     simple_tests,  # Backward compatibility
 )
 
@@ -40,5 +45,10 @@ __all__ = [
     "assert_about_opens",
     "assert_about_computer_opens",
     "run_tests",
+    "run_tests_parallel",
+    "wait_until",
+    "readonly",
+    "READONLY",
+    "cacheable_smoke",
     "simple_tests",
 ]
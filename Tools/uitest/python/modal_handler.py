@@ -71,6 +71,8 @@ class ModalHandler:
         """
         self.workspace_name = workspace_name
         self._known_workspace_windows: List[str] = []
+        # (monotonic time, result) of the last clean pre_click_check()
+        self._last_clean_check: Optional[Tuple[float, Dict[str, Any]]] = None
     
     def _run_xdotool(self, *args) -> Tuple[str, int]:
         """Run xdotool command and return (stdout, returncode)."""
@@ -109,12 +111,17 @@ class ModalHandler:
         Returns:
             WindowInfo or None if cannot determine
         """
+        wid = self.get_active_window_id()
+        if wid is None:
+            return None
+        return self.get_window_info(wid)
+    
+    def get_active_window_id(self) -> Optional[str]:
+        """Get the X11 id of the focused window, or None."""
         output, code = self._run_xdotool("getactivewindow")
         if code != 0 or not output:
             return None
-        
-        wid = output.strip()
-        return self.get_window_info(wid)
+        return output.strip()
     
     def get_window_info(self, window_id: str) -> Optional[WindowInfo]:
         """
@@ -207,6 +214,11 @@ class ModalHandler:
         
         return False
     
+    def is_normal_workspace_window(self, window: WindowInfo) -> bool:
+        """Check if a window is a Workspace window other than a dialog."""
+        return (self.is_workspace_window(window)
+                and not window.looks_like_alert and not window.is_small_dialog)
+    
     def has_focus_stealer(self, expected_focus: Optional[str] = None) -> bool:
         """
         Check if something unexpected has stolen focus.
@@ -244,7 +256,7 @@ class ModalHandler:
                 return False
             return True  # Non-Workspace window
     
-    def detect_modal_dialog(self) -> Optional[WindowInfo]:
+    def detect_modal_dialog(self, focused: Optional[WindowInfo] = None) -> Optional[WindowInfo]:
         """
         Detect if a modal dialog is currently displayed.
         
@@ -253,10 +265,14 @@ class ModalHandler:
         - Windows with alert/warning keywords
         - Windows that are not the main viewer/desktop
         
+        Args:
+            focused: The focused window if already known; looked up if None
+            
         Returns:
             WindowInfo of modal, or None
         """
-        focused = self.get_focused_window()
+        if focused is None:
+            focused = self.get_focused_window()
         if not focused:
             return None
         
@@ -297,6 +313,24 @@ class ModalHandler:
         
         return False
     
+    def dismiss_all_in_one_shot(self) -> bool:
+        """
+        Send Escape to every visible GNUstep alert window with one xdotool call.
+        
+        xdotool matches windows whose WM_CLASS is GNUstep *and* whose name
+        (case-insensitively) looks like an alert, and runs the key command
+        on each match via %@. Other applications' windows are never touched.
+        
+        Returns:
+            True if xdotool found at least one matching window
+        """
+        _, code = self._run_xdotool(
+            "search", "--all", "--onlyvisible",
+            "--class", "GNUstep",
+            "--name", "(alert|error|warning|confirm|dialog)",
+            "key", "--window", "%@", "Escape")
+        return code == 0
+    
     def dismiss_with_return(self) -> bool:
         """
         Try to dismiss modal by pressing Return (accept default).
@@ -415,7 +449,7 @@ class ModalHandler:
         for i in range(max_attempts):
             focused = self.get_focused_window()
             if focused and self.is_workspace_window(focused):
-                if not focused.looks_like_alert and not focused.is_small_dialog:
+                if self.is_normal_workspace_window(focused):
                     return True  # Good, normal Workspace window focused
                 else:
                     # It's a modal/dialog, try to dismiss
@@ -476,7 +510,25 @@ class ModalHandler:
             else:
                 result['ok'] = False
         
+        if result['ok'] and not result['actions_taken']:
+            self._last_clean_check = (time.monotonic(), result)
+        else:
+            self._last_clean_check = None
         return result
+    
+    def pre_click_check_cached(self, max_age: float = 0.05) -> Dict[str, Any]:
+        """
+        pre_click_check(), reusing a clean result from the last max_age seconds.
+        
+        Only a check that found nothing to do is reused, so closely spaced
+        clicks skip the xdotool queries while anything that needed action
+        is always rechecked.
+        """
+        if self._last_clean_check is not None:
+            checked_at, result = self._last_clean_check
+            if time.monotonic() - checked_at < max_age:
+                return result
+        return self.pre_click_check()
 
 
 # Global instance
@@ -11,13 +11,14 @@ When a test fails, this module captures:
 This helps debug what went wrong without querying the (possibly blocked) UI.
 """
 
+import hashlib
 import subprocess
 import os
 import sys
 import time
 import traceback
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from functools import wraps
 
 
@@ -49,6 +50,8 @@ class FailureCapture:
         self._ensure_output_dir()
         self._test_name = "unknown"
         self._log_lines: List[str] = []
+        # Digest and path of the last screenshot, to drop identical repeats
+        self._last_screenshot: Optional[Tuple[bytes, str]] = None
     
     def _ensure_output_dir(self):
         """Create output directory if it doesn't exist."""
@@ -94,8 +97,7 @@ class FailureCapture:
                 timeout=5
             )
             if result.returncode == 0:
-                self.log(f"Screenshot saved: {filepath}")
-                return filepath
+                return self._saved_screenshot(filepath)
         except FileNotFoundError:
             pass
         except Exception as e:
@@ -109,8 +111,7 @@ class FailureCapture:
                 timeout=10
             )
             if result.returncode == 0:
-                self.log(f"Screenshot saved: {filepath}")
-                return filepath
+                return self._saved_screenshot(filepath)
         except FileNotFoundError:
             pass
         except Exception as e:
@@ -131,14 +132,39 @@ class FailureCapture:
             )
             if os.path.exists(filepath):
                 os.remove(xwd_file)
-                self.log(f"Screenshot saved: {filepath}")
-                return filepath
+                return self._saved_screenshot(filepath)
         except Exception as e:
             self.log(f"xwd+convert failed: {e}")
         
         self.log("WARNING: Could not capture screenshot (no tool available)")
         return None
     
+    def _saved_screenshot(self, filepath: str) -> str:
+        """
+        Keep a new screenshot unless it matches the previous one.
+        
+        A burst of failures against the same screen would otherwise leave
+        a pile of identical PNGs; the repeat is deleted and the earlier
+        file's path returned instead.
+        """
+        try:
+            with open(filepath, 'rb') as f:
+                digest = hashlib.blake2b(f.read(), digest_size=8).digest()
+        except OSError:
+            self.log(f"Screenshot saved: {filepath}")
+            return filepath
+        
+        if self._last_screenshot is not None and self._last_screenshot[0] == digest:
+            previous = self._last_screenshot[1]
+            if os.path.exists(previous):
+                os.remove(filepath)
+                self.log(f"Screenshot unchanged, see: {previous}")
+                return previous
+        
+        self._last_screenshot = (digest, filepath)
+        self.log(f"Screenshot saved: {filepath}")
+        return filepath
+    
     def get_focused_window_info(self) -> Dict[str, Any]:
         """
         Get information about the currently focused window using xdotool.
@@ -16,10 +16,16 @@ Example:
 """
 
 import subprocess
+import functools
+import hashlib
 import json
 import sys
 import os
-from typing import Dict, List, Optional, Tuple, Any
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, Any
 
 
 class UITestException(Exception):
@@ -56,6 +62,13 @@ class WorkspaceTestClient:
         assert client.window_exists("About Workspace")
     """
     
+    # Seconds a window list is reused by window_exists/get_visible_windows
+    WINDOWS_CACHE_TTL = 0.05
+    # uitest commands that can open or close windows
+    WINDOW_COMMANDS = ("about", "aboutcomputer", "click", "close-class",
+                       "close-window", "menu", "run-script", "shortcut",
+                       "wait-window")
+    
     def __init__(self, uitest_path: Optional[str] = None):
         """
         Initialize the test client.
@@ -66,6 +79,15 @@ class WorkspaceTestClient:
         self.uitest_path = uitest_path or self._find_uitest()
         self._verify_uitest()
         self._last_json_response = None
+        self._menu_item_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._build_hash: Optional[str] = None
+        self._screen_size: Optional[Tuple[int, int]] = None
+        self._windows_cache: Optional[List[Dict[str, Any]]] = None
+        self._windows_cache_time = 0.0
+        self._key_window: Optional[Tuple[Any, Any]] = None
+        # Guards the caches above; read-only tests share one client across
+        # run_tests()' worker threads
+        self._cache_lock = threading.RLock()
         
     def _find_uitest(self) -> str:
         """Find uitest executable in PATH."""
@@ -143,6 +165,9 @@ class WorkspaceTestClient:
         """
         cmd = [self.uitest_path] + list(args)
         
+        if args[0] in self.WINDOW_COMMANDS:
+            self.invalidate_windows_cache()
+        
         try:
             result = subprocess.run(
                 cmd,
@@ -183,7 +208,8 @@ class WorkspaceTestClient:
         
         try:
             data = json.loads(json_text)
-            self._last_json_response = data
+            with self._cache_lock:
+                self._last_json_response = data
             return data
         except json.JSONDecodeError as e:
             raise UITestException(f"Failed to parse JSON response: {e}")
@@ -224,6 +250,21 @@ class WorkspaceTestClient:
         
         return self._extract_json(stdout)
     
+    def _cached_windows(self) -> List[Dict[str, Any]]:
+        """All windows in the UI state, reused for WINDOWS_CACHE_TTL seconds."""
+        with self._cache_lock:
+            now = time.monotonic()
+            if (self._windows_cache is None or
+                    now - self._windows_cache_time >= self.WINDOWS_CACHE_TTL):
+                self._windows_cache = self.query_ui_state().get('windows', [])
+                self._windows_cache_time = now
+            return self._windows_cache
+    
+    def invalidate_windows_cache(self) -> None:
+        """Forget the cached window list, e.g. after synthesized user input."""
+        with self._cache_lock:
+            self._windows_cache = None
+    
     def get_ui_at_coordinate(self, x: float, y: float) -> str:
         """
         Get human-readable tree of UI elements at screen coordinate.
@@ -378,6 +419,157 @@ class WorkspaceTestClient:
         """
         stdout, stderr, code = self._run_command("close-window", window_title)
         return self._extract_json(stdout)
+
+    def close_window_and_wait(self, window_title: str, timeout: float = 1.0) -> bool:
+        """
+        Close a window by title and wait until it is gone.
+
+        Args:
+            window_title: Title of window to close
+            timeout: Maximum seconds to wait for the window to disappear
+
+        Returns:
+            True if the window is closed (or was not open), False on timeout
+        """
+        result = self.close_window(window_title)
+        if not result.get('success'):
+            return result.get('error') == 'Window not found'
+        return self.wait_for_window_gone(window_title, timeout)
+
+    def screen_size(self) -> Tuple[int, int]:
+        """
+        Get the X display size, queried once per client.
+        
+        Returns:
+            Tuple of (width, height) in pixels
+        """
+        if self._screen_size is None:
+            stdout, stderr, code = self._run_command("screen-size")
+            if code != 0:
+                raise CommandFailedError(f"Failed to get screen size: {stderr}")
+            data = self._extract_json(stdout)
+            self._screen_size = (int(data['width']), int(data['height']))
+        return self._screen_size
+    
+    def key_window_info(self) -> Dict[str, Any]:
+        """
+        Describe Workspace's key window.
+        
+        Returns:
+            Dictionary with: success, active (Workspace is the active app),
+            and title/class of the key window when active
+        """
+        stdout, stderr, code = self._run_command("key-window")
+        info = self._extract_json(stdout)
+        
+        # Menu items validate against the key window; drop stale ones
+        key_window = (info.get('title'), info.get('class'))
+        with self._cache_lock:
+            if key_window != self._key_window:
+                self._key_window = key_window
+                self.invalidate_menu_cache()
+        
+        return info
+    
+    def focused_window_class(self) -> Optional[str]:
+        """
+        Get the class of Workspace's key window.
+        
+        Returns:
+            Class name (e.g., "GWViewerWindow"), or None if Workspace does
+            not have keyboard focus
+        """
+        return self.key_window_info().get('class')
+    
+    def focused_window(self) -> Optional[str]:
+        """
+        Get the title of Workspace's key window.
+        
+        Returns:
+            Window title, or None if Workspace does not have keyboard focus
+        """
+        return self.key_window_info().get('title')
+    
+    def wait_until_focused(self, title: str, timeout: float = 0.5,
+                           interval: float = 0.01) -> bool:
+        """
+        Wait until the window with the given title is Workspace's key window.
+        
+        Args:
+            title: Window title to wait for
+            timeout: Maximum seconds to wait
+            interval: Seconds between checks
+            
+        Returns:
+            True if the window has focus, False if timeout
+        """
+        return wait_until(lambda: self.focused_window() == title, timeout, interval)
+    
+    def build_info(self) -> Dict[str, Any]:
+        """
+        Describe the running Workspace build.
+        
+        Returns:
+            Dictionary with: success, release (ApplicationRelease from the
+            Info.plist), executable, size and modified (executable mtime)
+        """
+        stdout, stderr, code = self._run_command("build-info")
+        return self._extract_json(stdout)
+    
+    def build_hash(self) -> str:
+        """
+        Short fingerprint of the running Workspace build.
+        
+        Changes whenever Workspace is rebuilt or reinstalled. Queried once
+        per client.
+        
+        Returns:
+            12-character hex string
+        """
+        if self._build_hash is None:
+            info = self.build_info()
+            if not info.get('success'):
+                raise CommandFailedError(f"Failed to get build info: {info.get('error')}")
+            fields = {key: info.get(key)
+                      for key in ('release', 'version', 'executable', 'size', 'modified')}
+            digest = hashlib.sha1(json.dumps(fields, sort_keys=True).encode('utf-8'))
+            self._build_hash = digest.hexdigest()[:12]
+        return self._build_hash
+    
+    def close_window_by_class(self, class_name: str, count: int = 1) -> Dict[str, Any]:
+        """
+        Close visible windows of a class, key window first.
+        
+        Does nothing (and still succeeds) when no such window is open, so it
+        is safe to use for cleanup.
+        
+        Args:
+            class_name: Window class name (e.g., "GWViewerWindow")
+            count: Maximum number of windows to close (0 closes all)
+            
+        Returns:
+            Dictionary with result: {"success": true/false, "closed": [titles], "count": n}
+        """
+        stdout, stderr, code = self._run_command("close-class", class_name, str(count))
+        return self._extract_json(stdout)
+    
+    def set_text_field(self, window_title: str, value: str) -> Dict[str, Any]:
+        """
+        Set the text of an editable field in a window in one round trip.
+        
+        The field being edited is used if there is one, otherwise the first
+        editable text field in the window. The field's action is sent after
+        the value is set, as if Return had been pressed.
+        
+        Args:
+            window_title: Window title containing the field
+            value: New text for the field (empty string clears it)
+            
+        Returns:
+            Dictionary with result: {"success": true/false, "class": "NSTextField", "value": "..."}
+        """
+        stdout, stderr, code = self._run_command("set-text", window_title, value)
+        return self._extract_json(stdout)
     
     def find_element(self, window_title: str, text: str) -> Dict[str, Any]:
         """
@@ -441,8 +633,7 @@ class WorkspaceTestClient:
             True if window exists, False otherwise
         """
         try:
-            state = self.query_ui_state()
-            windows = state.get('windows', [])
+            windows = self._cached_windows()
             
             for window in windows:
                 # Check both 'title' and 'windowTitle' for compatibility
@@ -770,10 +961,22 @@ class WorkspaceTestClient:
         Returns:
             List of visible window dictionaries
         """
-        state = self.query_ui_state()
-        windows = state.get('windows', [])
+        windows = self._cached_windows()
         return [w for w in windows if w.get('visibility') == 'visible']
     
+    def first_of_class(self, class_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the first visible window of a class.
+        
+        Args:
+            class_name: Window class name (e.g., "GWViewerWindow")
+            
+        Returns:
+            Window dictionary, or None if no such window is visible
+        """
+        return next((w for w in self.get_visible_windows()
+                     if w.get('class') == class_name), None)
+    
     def get_window_titles(self) -> List[str]:
         """
         Get list of all window titles.
@@ -819,6 +1022,25 @@ class WorkspaceTestClient:
         
         return texts
     
+    def get_info_panel(self, window_title: str = 'Info') -> Dict[str, str]:
+        """
+        Read the Info inspector as a label -> value mapping.
+        
+        Keys are the panel's labels lowercased, without the trailing colon
+        and with spaces as underscores: 'size', 'owner', 'group', 'link_to',
+        plus titled boxes such as 'changed' (the modification date).
+        
+        Args:
+            window_title: Title of the inspector window (default "Info")
+            
+        Returns:
+            Dictionary of label to value, empty if the window is not open
+        """
+        stdout, stderr, code = self._run_command("fields", window_title)
+        data = self._extract_json(stdout)
+        return {label.strip().lower().replace(' ', '_'): value
+                for label, value in data.get('fields', {}).items()}
+    
     def count_elements_by_class(self, class_name: str) -> int:
         """
         Count UI elements with a specific class.
@@ -829,28 +1051,43 @@ class WorkspaceTestClient:
         Returns:
             Number of elements found
         """
-        count = 0
+        return self.element_class_counts()[class_name]
+    
+    def element_class_counts(self, window_title: Optional[str] = None) -> Counter:
+        """
+        Tally UI elements by class from a single UI query.
+        
+        Use this instead of several count_elements_by_class() calls when
+        checking more than one class.
+        
+        Args:
+            window_title: Only count elements in this window (default: all)
+            
+        Returns:
+            Counter of class name -> number of elements
+        """
+        counts = Counter()
         
-        def count_class(obj):
-            nonlocal count
+        def count_classes(obj):
             if isinstance(obj, dict):
-                if obj.get('class') == class_name:
-                    count += 1
+                if 'class' in obj:
+                    counts[obj['class']] += 1
                 for key in ['children', 'contentView', 'views']:
                     if key in obj:
-                        count_class(obj[key])
+                        count_classes(obj[key])
             elif isinstance(obj, list):
                 for item in obj:
-                    count_class(item)
+                    count_classes(item)
         
         try:
             state = self.query_ui_state()
             for window in state.get('windows', []):
-                count_class(window)
+                if window_title is None or window.get('title') == window_title:
+                    count_classes(window)
         except Exception:
             pass
         
-        return count
+        return counts
     
     def is_workspace_running(self) -> bool:
         """Check if Workspace is running and responding to commands."""
@@ -929,13 +1166,45 @@ class WorkspaceTestClient:
         Returns:
             True if window closed, False if timeout
         """
-        import time
-        start = time.time()
-        while time.time() - start < timeout:
-            if not self.window_exists(title):
-                return True
-            time.sleep(0.2)
-        return False
+        return self.wait_for_window_gone(title, timeout, interval=0.2)
+
+    def wait_for_window_open(self, title: str, timeout: float = 2.0,
+                             interval: float = 0.02) -> bool:
+        """
+        Wait until a window with the given title is on screen.
+        
+        Waits inside Workspace via wait-window, which returns as soon as
+        the window is visible, so the common case costs one round trip.
+        Falls back to polling the UI state every interval seconds when
+        Workspace doesn't support wait-window.
+        
+        Args:
+            title: Window title to wait for
+            timeout: Maximum seconds to wait
+            interval: Seconds between checks when polling
+            
+        Returns:
+            True if the window appeared, False if timeout
+        """
+        try:
+            return bool(self.wait_for_window(title, timeout).get('success'))
+        except UITestException:
+            return wait_until(lambda: self.window_exists(title), timeout, interval)
+
+    def wait_for_window_gone(self, title: str, timeout: float = 2.0,
+                             interval: float = 0.02) -> bool:
+        """
+        Poll until no window with the given title exists.
+        
+        Args:
+            title: Window title to wait for closure
+            timeout: Maximum seconds to wait
+            interval: Seconds between checks
+            
+        Returns:
+            True if the window is gone, False if timeout
+        """
+        return wait_until(lambda: not self.window_exists(title), timeout, interval)
 
     # File System Helper Methods
     
@@ -1121,22 +1390,49 @@ class WorkspaceTestClient:
     
     def get_menu_item(self, menu_title: str, item_title: str) -> Dict[str, Any]:
         """
-        Get detailed info about a specific menu item.
+        Get the static details of a specific menu item.
+        
+        The menu bar is fetched once and every item's static fields (title,
+        shortcut, action, ...) are cached by (menu, item) title, so later
+        lookups cost no round trip. The enabled state changes with the UI
+        and is not included; use is_menu_item_enabled() for it. The cache
+        is dropped when key_window_info() sees a different key window, or
+        by invalidate_menu_cache() after changing the menus.
         
         Args:
             menu_title: Menu name (e.g., "File")
             item_title: Menu item name (e.g., "New Folder")
             
         Returns:
-            Dictionary with item details
+            Dictionary with item details, without 'enabled'
         """
-        items = self.get_menu_items(menu_title)
+        key = (menu_title, item_title)
         
-        for item in items:
-            if item.get('title') == item_title:
-                return item
+        with self._cache_lock:
+            if key not in self._menu_item_cache:
+                self._cache_menu_items()
+            item = self._menu_item_cache.get(key)
         
-        raise UITestException(f"Menu item not found: {menu_title} > {item_title}")
+        if item is None:
+            raise UITestException(f"Menu item not found: {menu_title} > {item_title}")
+        return dict(item)
+    
+    def _cache_menu_items(self) -> None:
+        """Fetch the menu bar once and index its items' static fields by (menu, item) title."""
+        state = self.get_menu_state()
+        
+        with self._cache_lock:
+            for menu in state.get('menus', []):
+                for item in menu.get('items', []):
+                    if not item.get('separator'):
+                        key = (menu.get('title'), item.get('title'))
+                        static = {k: v for k, v in item.items() if k != 'enabled'}
+                        self._menu_item_cache.setdefault(key, static)
+    
+    def invalidate_menu_cache(self) -> None:
+        """Forget cached menu items so the next get_menu_item() refetches."""
+        with self._cache_lock:
+            self._menu_item_cache.clear()
     
     def get_enabled_menu_items(self, menu_title: str = None) -> List[Dict[str, Any]]:
         """
@@ -1245,8 +1541,170 @@ def test_workspace_responding() -> bool:
         return False
 
 
+READONLY = 'readonly'
+
+
+def readonly(func: Callable) -> Callable:
+    """
+    Mark a test as read-only.
+    
+    Read-only tests only query Workspace (menus, window lists, element
+    trees) and never change UI state, so run_tests runs them concurrently
+    ahead of the other tests. A lambda can be marked instead by adding
+    READONLY as a third element of its (name, function) tuple.
+    
+    Usage:
+        @readonly
+        def test_find_menu_enabled():
+            return client.is_menu_item_enabled('File', 'Find')
+    """
+    func.readonly = True
+    return func
+
+
+def wait_until(condition: Callable[[], Any], timeout: float = 5.0,
+               interval: float = 0.05) -> bool:
+    """
+    Poll a condition until it is true or the timeout expires.
+    
+    Args:
+        condition: Callable returning a truthy value when done
+        timeout: Maximum seconds to wait
+        interval: Seconds between checks
+        
+    Returns:
+        True if the condition became true, False on timeout
+    """
+    deadline = time.time() + timeout
+    while True:
+        if condition():
+            return True
+        if time.time() >= deadline:
+            return False
+        time.sleep(interval)
+
+
+SMOKE_CACHE_DIR = os.path.expanduser('~/.cache/uitest')
+
+
+def cacheable_smoke(client: 'WorkspaceTestClient') -> Callable:
+    """
+    Cache passing results of smoke tests per Workspace build.
+    
+    For tests that only check that an action doesn't break anything. With
+    UITEST_SMOKE_CACHE=1 in the environment, a pass is recorded in
+    ~/.cache/uitest/<suite>/<test>.<build hash> and later runs against the
+    same build return True without repeating the UI actions. Failures are
+    never cached, and without the variable (e.g. in CI) tests always run.
+    
+    Usage:
+        @cacheable_smoke(client)
+        def test_shortcut_undo():
+            user.cmd('z')
+            return True
+    
+    Args:
+        client: WorkspaceTestClient used to fingerprint the build
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if os.environ.get('UITEST_SMOKE_CACHE') != '1':
+                return func(*args, **kwargs)
+            
+            try:
+                build = client.build_hash()
+            except UITestException:
+                return func(*args, **kwargs)
+            
+            module = sys.modules.get(func.__module__)
+            suite = os.path.splitext(os.path.basename(
+                getattr(module, '__file__', None) or func.__module__))[0]
+            marker = os.path.join(SMOKE_CACHE_DIR, suite, f"{func.__name__}.{build}")
+            
+            if os.path.exists(marker):
+                return True
+            
+            start = time.time()
+            result = func(*args, **kwargs)
+            
+            if result is not False:
+                os.makedirs(os.path.dirname(marker), exist_ok=True)
+                with open(marker, 'w') as f:
+                    json.dump({'result': True, 'duration': time.time() - start}, f)
+            return result
+        return wrapper
+    return decorator
+
+
+def _split_test(test: tuple) -> Tuple[str, Callable, bool]:
+    """Unpack a (name, function[, READONLY]) test tuple."""
+    test_name, test_func = test[0], test[1]
+    is_readonly = READONLY in test[2:] or getattr(test_func, 'readonly', False)
+    return test_name, test_func, is_readonly
+
+
+def _execute_test(test_func: Callable) -> Tuple[bool, Optional[Exception]]:
+    """Run one test function, returning (passed, exception)."""
+    try:
+        # Allow test to return True/False or just raise on failure
+        return test_func() is not False, None
+    except Exception as e:
+        return False, e
+
+
+def _highlight_assertion_failure(client: 'WorkspaceTestClient',
+                                 error: AssertionFailedError) -> None:
+    """Highlight the element named in an assertion message, if any."""
+    try:
+        # Extract element text from error if possible
+        if "'" in str(error):
+            parts = str(error).split("'")
+            if len(parts) >= 2:
+                element_text = parts[1]
+                # Try to find and highlight in any visible window
+                state = client.query_ui_state()
+                for window in state.get('windows', []):
+                    title = window.get('title', '')
+                    if title:
+                        client.highlight_failure(title, element_text, 0)
+                        break
+    except:
+        pass  # Silently ignore highlighting errors
+
+
+def _report_test(test_name: str, passed: bool, error: Optional[Exception],
+                 verbose: bool, highlight_failures: bool,
+                 client: 'WorkspaceTestClient') -> None:
+    """Print the outcome of one test and highlight assertion failures."""
+    if passed:
+        if verbose:
+            print(f"\r✓ {test_name}")
+    elif error is None:
+        if verbose:
+            print(f"\r✗ {test_name}")
+    elif isinstance(error, AssertionFailedError):
+        if verbose:
+            print(f"\r✗ {test_name}: {error}")
+        if highlight_failures and client:
+            _highlight_assertion_failure(client, error)
+    else:
+        if verbose:
+            print(f"\r✗ {test_name}: {type(error).__name__}: {error}")
+
+
+def _report_stop(test_name: str, error: Optional[Exception]) -> None:
+    """Print the stop-on-failure banner."""
+    print(f"\n⛔ STOPPED: Test failed - {test_name}")
+    if isinstance(error, AssertionFailedError):
+        print(f"   Error: {error}")
+    elif error is not None:
+        print(f"   Error: {type(error).__name__}: {error}")
+
+
 def run_tests(*tests: tuple, verbose: bool = True, stop_on_failure: bool = False,
-               highlight_failures: bool = True, client: 'WorkspaceTestClient' = None) -> int:
+               highlight_failures: bool = True, client: 'WorkspaceTestClient' = None,
+               max_workers: int = 8, between_tests: float = 0) -> int:
     """
     Run a list of tests with minimal boilerplate.
     
@@ -1259,6 +1717,9 @@ def run_tests(*tests: tuple, verbose: bool = True, stop_on_failure: bool = False
     - Stop-on-failure: Stop execution at first failure
     - Failure highlighting: Mark failed elements with red overlay in the UI
     - Visual feedback: See what's happening on screen during test execution
+    - Tests run in the order given; each unbroken run of read-only tests
+      (see readonly()) runs concurrently, since they spend their time
+      waiting on Workspace round trips
     
     Usage:
         from uitest import WorkspaceTestClient, run_tests
@@ -1275,11 +1736,16 @@ def run_tests(*tests: tuple, verbose: bool = True, stop_on_failure: bool = False
         ))
     
     Args:
-        *tests: Tuples of (test_name: str, test_function: callable)
+        *tests: Tuples of (test_name: str, test_function: callable), optionally
+                with READONLY as a third element
         verbose: Whether to print results (default True)
         stop_on_failure: Stop at first failing test (default False)
         highlight_failures: Highlight failed elements in red (default True)
         client: WorkspaceTestClient instance for highlighting (optional)
+        max_workers: Threads used for each run of adjacent read-only tests
+                     (1 runs everything serially)
+        between_tests: Seconds to let the UI settle between serial tests
+                       (default 0)
     
     Returns:
         0 if all tests pass, 1 if any fail
@@ -1287,74 +1753,44 @@ def run_tests(*tests: tuple, verbose: bool = True, stop_on_failure: bool = False
     if not tests:
         return 0
     
+    # Group adjacent read-only tests into one concurrent batch; every
+    # other test is a batch of its own
+    batches: List[Tuple[bool, List[Tuple[str, Callable]]]] = []
+    for name, func, ro in (_split_test(test) for test in tests):
+        concurrent = ro and max_workers > 1
+        if concurrent and batches and batches[-1][0]:
+            batches[-1][1].append((name, func))
+        else:
+            batches.append((concurrent, [(name, func)]))
+    
     results = []
-    failed_test_name = None
-    failed_error = None
+    stopped = False
     
-    for test_name, test_func in tests:
-        try:
+    for index, (concurrent, batch) in enumerate(batches):
+        if index and between_tests > 0:
+            time.sleep(between_tests)
+        
+        if concurrent:
+            workers = min(max_workers, len(batch))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(_execute_test,
+                                         [func for _, func in batch]))
+        else:
+            test_name, test_func = batch[0]
             if verbose:
                 print(f"▶ Running: {test_name}", end='', flush=True)
-            
-            result = test_func()
-            
-            # Allow test to return True/False or just raise on failure
-            if result is False:
-                if verbose:
-                    print(f"\r✗ {test_name}")
-                results.append(False)
-                failed_test_name = test_name
-                
-                if stop_on_failure:
-                    print(f"\n⛔ STOPPED: Test failed - {test_name}")
-                    break
-            else:
-                if verbose:
-                    print(f"\r✓ {test_name}")
-                results.append(True)
-                
-        except AssertionFailedError as e:
-            if verbose:
-                print(f"\r✗ {test_name}: {e}")
-            results.append(False)
-            failed_test_name = test_name
-            failed_error = str(e)
-            
-            # Try to highlight the failed element if client is provided
-            if highlight_failures and client:
-                try:
-                    # Extract element text from error if possible
-                    if "'" in str(e):
-                        parts = str(e).split("'")
-                        if len(parts) >= 2:
-                            element_text = parts[1]
-                            # Try to find and highlight in any visible window
-                            state = client.query_ui_state()
-                            for window in state.get('windows', []):
-                                title = window.get('title', '')
-                                if title:
-                                    client.highlight_failure(title, element_text, 0)
-                                    break
-                except:
-                    pass  # Silently ignore highlighting errors
-            
-            if stop_on_failure:
-                print(f"\n⛔ STOPPED: Test failed - {test_name}")
-                if failed_error:
-                    print(f"   Error: {failed_error}")
-                break
-                
-        except Exception as e:
-            if verbose:
-                print(f"\r✗ {test_name}: {type(e).__name__}: {e}")
-            results.append(False)
-            failed_test_name = test_name
-            failed_error = str(e)
-            
-            if stop_on_failure:
-                print(f"\n⛔ STOPPED: Test failed - {test_name}")
-                print(f"   Error: {type(e).__name__}: {e}")
+            outcomes = [_execute_test(test_func)]
+        
+        for (test_name, _), (passed, error) in zip(batch, outcomes):
+            _report_test(test_name, passed, error, verbose, highlight_failures, client)
+            results.append(passed)
+            if not passed and stop_on_failure:
+                _report_stop(test_name, error)
+                stopped = True
                 break
+        
+        if stopped:
+            break
     
     if verbose:
         passed = sum(results)
@@ -1374,6 +1810,29 @@ def run_tests(*tests: tuple, verbose: bool = True, stop_on_failure: bool = False
     return 0 if all(results) else 1
 
 
+def run_tests_parallel(*tests: tuple, workers: Optional[int] = None,
+                       **kwargs) -> int:
+    """
+    Run every test concurrently, as if each were marked readonly().
+    
+    Only for suites whose tests are pure queries (menu state, window
+    lists) with no UI side effects. Results are still reported in the
+    order given.
+    
+    Args:
+        *tests: Tuples of (test_name: str, test_function: callable)
+        workers: Thread count (default: CPU count minus two, at least 1)
+        **kwargs: Additional arguments passed to run_tests
+        
+    Returns:
+        0 if all tests pass, 1 if any fail
+    """
+    if workers is None:
+        workers = max(1, (os.cpu_count() or 1) - 2)
+    tests = tuple(tuple(test) + (READONLY,) for test in tests)
+    return run_tests(*tests, max_workers=workers, **kwargs)
+
+
 def run_interactive_tests(*tests: tuple, client: 'WorkspaceTestClient' = None,
                           pause_between: float = 0.5, **kwargs) -> int:
     """
@@ -1393,8 +1852,6 @@ def run_interactive_tests(*tests: tuple, client: 'WorkspaceTestClient' = None,
     Returns:
         0 if all tests pass, 1 if any fail
     """
-    import time
-    
     # Default to stop-on-failure for interactive testing
     kwargs.setdefault('stop_on_failure', True)
     kwargs.setdefault('highlight_failures', True)
@@ -1406,13 +1863,15 @@ def run_interactive_tests(*tests: tuple, client: 'WorkspaceTestClient' = None,
     
     # Wrap tests to add pause between them
     def make_paused_test(original_func):
+        @functools.wraps(original_func)
         def paused():
             result = original_func()
             time.sleep(pause_between)
             return result
         return paused
     
-    paused_tests = tuple((name, make_paused_test(func)) for name, func in tests)
+    paused_tests = tuple((test[0], make_paused_test(test[1])) + tuple(test[2:])
+                         for test in tests)
     
     return run_tests(*paused_tests, **kwargs)
 
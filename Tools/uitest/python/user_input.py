@@ -12,7 +12,22 @@ import time
 import os
 import math
 import random
-from typing import Optional, Tuple, List
+from typing import Callable, Optional, Tuple, List
+
+# python-xlib is optional: with it, key presses, clicks and pointer moves
+# go through the XTest extension on one X connection instead of forking
+# an xdotool for each event.
+try:
+    from Xlib import X, XK, display as xdisplay
+    from Xlib.ext import xtest
+except ImportError:
+    xdisplay = None
+
+# xdotool modifier names and the keysyms XTest presses for them
+_MODIFIER_KEYSYMS = {
+    'alt': 'Alt_L', 'ctrl': 'Control_L', 'control': 'Control_L',
+    'shift': 'Shift_L', 'super': 'Super_L', 'meta': 'Meta_L',
+}
 
 class UserInputError(Exception):
     """Error during user input simulation."""
@@ -27,6 +42,12 @@ class UserInput:
     no internal application APIs are used.
     """
     
+    # xdotool commands that can change what the application shows
+    INPUT_COMMANDS = ("key", "type", "click", "mousedown", "mouseup",
+                      "windowactivate")
+    # xdotool commands that change the focused window
+    FOCUS_COMMANDS = ("windowactivate",)
+    
     def __init__(self):
         """Initialize and verify xdotool is available."""
         self._verify_xdotool()
@@ -34,6 +55,10 @@ class UserInput:
         self.type_delay = 20  # ms between typed characters
         self._current_mouse_pos = None  # Track mouse position for smooth moves
         self._mouse_speed = 800  # pixels per second for smooth movement
+        self._input_listeners: List[Callable[[], None]] = []
+        self._focus_listeners: List[Callable[[], None]] = []
+        self._xdisplay = None  # XTest connection, opened on first use
+        self._xtest_ok = xdisplay is not None
     
     def _verify_xdotool(self):
         """Verify xdotool is installed."""
@@ -43,11 +68,96 @@ class UserInput:
     
     def _run(self, *args) -> str:
         """Run xdotool command and return output."""
-        cmd = ["xdotool"] + list(args)
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode != 0:
-            raise UserInputError(f"xdotool failed: {result.stderr}")
-        return result.stdout.strip()
+        if self._xtest_run(args):
+            output = ""
+        else:
+            cmd = ["xdotool"] + list(args)
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+            if result.returncode != 0:
+                raise UserInputError(f"xdotool failed: {result.stderr}")
+            output = result.stdout.strip()
+        if args[0] in self.INPUT_COMMANDS:
+            for listener in self._input_listeners:
+                listener()
+        if args[0] in self.FOCUS_COMMANDS:
+            for listener in self._focus_listeners:
+                listener()
+        return output
+    
+    def _xtest_display(self):
+        """The XTest-capable display, or None to use xdotool."""
+        if self._xdisplay is None and self._xtest_ok:
+            try:
+                dpy = xdisplay.Display()
+                if dpy.has_extension('XTEST'):
+                    self._xdisplay = dpy
+                else:
+                    dpy.close()
+                    self._xtest_ok = False
+            except Exception:
+                self._xtest_ok = False  # Don't retry on every call
+        return self._xdisplay
+    
+    def _xtest_keycodes(self, dpy, keyspec: str) -> Optional[List[int]]:
+        """Keycodes to press for an xdotool key spec like "alt+shift+h"."""
+        keycodes = []
+        for name in keyspec.split('+'):
+            keysym = XK.string_to_keysym(_MODIFIER_KEYSYMS.get(name.lower(), name))
+            if not keysym and len(name) == 1 and 0x20 <= ord(name) <= 0xff:
+                keysym = ord(name)  # Latin-1 keysyms are their code points
+            keycode = dpy.keysym_to_keycode(keysym) if keysym else 0
+            # Keys needing a shift level are left to xdotool, which remaps
+            if not keycode or dpy.keycode_to_keysym(keycode, 0) != keysym:
+                return None
+            keycodes.append(keycode)
+        return keycodes
+    
+    def _xtest_run(self, args) -> bool:
+        """
+        Perform a mousemove, click or key command through XTest.
+        
+        Returns False, having sent nothing, for anything it can't do
+        exactly as xdotool would, so _run falls back to xdotool.
+        """
+        dpy = self._xtest_display() if args[0] in ("mousemove", "click", "key") else None
+        if dpy is None:
+            return False
+        
+        if args[0] == "mousemove" and len(args) == 3:
+            xtest.fake_input(dpy, X.MotionNotify, x=int(args[1]), y=int(args[2]))
+        elif args[0] == "click" and len(args) == 2:
+            xtest.fake_input(dpy, X.ButtonPress, int(args[1]))
+            xtest.fake_input(dpy, X.ButtonRelease, int(args[1]))
+        elif args[0] == "key" and len(args) > 3 and args[1] == "--delay":
+            chords = [self._xtest_keycodes(dpy, spec) for spec in args[3:]]
+            if any(chord is None for chord in chords):
+                return False
+            for i, chord in enumerate(chords):
+                if i:
+                    dpy.sync()
+                    time.sleep(int(args[2]) / 1000)
+                for keycode in chord:
+                    xtest.fake_input(dpy, X.KeyPress, keycode)
+                for keycode in reversed(chord):
+                    xtest.fake_input(dpy, X.KeyRelease, keycode)
+        else:
+            return False
+        
+        dpy.sync()
+        return True
+    
+    def add_input_listener(self, listener: Callable[[], None]):
+        """
+        Call listener after every key press, click, drag or focus change.
+        
+        Used to drop state cached from before the input, e.g.
+        user.add_input_listener(client.invalidate_windows_cache).
+        """
+        self._input_listeners.append(listener)
+    
+    def add_focus_listener(self, listener: Callable[[], None]):
+        """Call listener after every window focus change."""
+        self._focus_listeners.append(listener)
     
     def _get_mouse_position(self) -> Tuple[int, int]:
         """Get current mouse position."""
@@ -178,6 +288,31 @@ class UserInput:
         self._run("type", "--delay", str(self.type_delay), text)
         time.sleep(0.1)
     
+    def paste_text(self, text: str):
+        """
+        Enter text by pasting it instead of typing it key by key.
+        
+        Puts the text on the X CLIPBOARD selection with xclip and sends
+        Cmd+V, so the cost doesn't grow with the length of the text. This
+        replaces the clipboard contents. Falls back to type_text() when
+        xclip is not installed.
+        
+        Args:
+            text: Text to paste into the focused field
+        """
+        try:
+            # xclip stays in the background to serve the selection, so its
+            # output must not be captured or run() would wait for it
+            subprocess.run(["xclip", "-selection", "clipboard", "-in"],
+                           input=text, text=True, check=True, timeout=5,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except (FileNotFoundError, subprocess.CalledProcessError,
+                subprocess.TimeoutExpired):
+            self.type_text(text)
+            return
+        
+        self.cmd('v')
+    
     def shortcut(self, *keys: str):
         """
         Send a keyboard shortcut.
@@ -202,6 +337,22 @@ class UserInput:
         """
         self.key(f"alt+{key}")
     
+    def cmd_batch(self, keys: List[str], delay: int = 20):
+        """
+        Send several Command+key presses with a single xdotool call.
+        
+        Args:
+            keys: Keys to combine with Command, sent in order
+            delay: Milliseconds between presses
+            
+        Example:
+            user.cmd_batch(['n', 'n', 'n'])  # Three new viewers
+        """
+        if not keys:
+            return
+        self._run("key", "--delay", str(delay), *[f"alt+{k}" for k in keys])
+        time.sleep(0.1)  # Allow UI to process
+    
     def cmd_shift(self, key: str):
         """Send Command+Shift+key (Alt+Shift on GNUstep)."""
         self.key(f"alt+shift+{key}")
@@ -214,6 +365,18 @@ class UserInput:
         """Press Escape key."""
         self.key("Escape")
     
+    def press_escape_n(self, count: int):
+        """
+        Press Escape count times with a single xdotool call.
+        
+        xdotool sends the keys in order, key_delay ms apart, so this
+        replaces a loop of press_escape() calls and sleeps.
+        """
+        if count <= 0:
+            return
+        self._run("key", "--delay", str(self.key_delay), *["Escape"] * count)
+        time.sleep(0.1)  # Allow UI to process
+    
     def press_tab(self):
         """Press Tab key."""
         self.key("Tab")
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+conftest.py - pytest integration for the interactive test suites
+
+The interactive suites are plain scripts: each defines test_* functions
+that return True/False and runs them through run_tests() when executed
+directly. This file lets pytest collect the converted suites in one
+process. The suites share one WorkspaceTestClient and UserInput for the
+whole session through the get_client()/get_user() singletons in
+test_utils, instead of creating them once per file.
+
+Usage:
+    cd Tools/uitest/tests
+    pytest                                   # all converted suites
+    pytest test_43_interactive_edit.py -v    # one suite
+
+Running a suite directly (python3 test_43_interactive_edit.py) still works
+and is what run_all_tests.py and run_interactive_tests.py do.
+"""
+
+import inspect
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python'))
+
+# Suites that use the shared client/user from test_utils. The other
+# test_*.py files are standalone scripts with import-time side effects
+# and are only collected when named explicitly.
+PYTEST_SUITES = {
+    'test_42_interactive_viewer.py',
+    'test_43_interactive_edit.py',
+    'test_44_interactive_info.py',
+    'test_45_interactive_finder.py',
+    'test_46_interactive_preferences.py',
+    'test_47_interactive_desktop.py',
+}
+
+
+def pytest_ignore_collect(collection_path, config):
+    """Skip test_*.py files that are not converted suites."""
+    if collection_path.suffix == '.py' and collection_path.name.startswith('test_'):
+        return collection_path.name not in PYTEST_SUITES
+    return None
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Treat a test returning False as a failure, as run_tests() does."""
+    funcargs = pyfuncitem.funcargs
+    params = inspect.signature(pyfuncitem.obj).parameters
+    result = pyfuncitem.obj(**{name: funcargs[name]
+                               for name in pyfuncitem.fixturenames
+                               if name in params})
+    if result is False:
+        pytest.fail(f"{pyfuncitem.name} returned False", pytrace=False)
+    return True
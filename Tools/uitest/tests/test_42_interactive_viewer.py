@@ -16,23 +16,21 @@ import time
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python'))
 
-from uitest import WorkspaceTestClient, run_tests
-from user_input import UserInput
+from uitest import cacheable_smoke, readonly, run_tests, wait_until
+from test_utils import center_of, get_client, get_user
 
-# Initialize
-client = WorkspaceTestClient()
-user = UserInput()
-
-# Screen dimensions
-SCREEN_WIDTH = 1920
-SCREEN_HEIGHT = 1080
+# Shared with the other suites when collected together by pytest
+client = get_client()
+user = get_user()
 
 
 def activate_workspace():
     """Ensure Workspace is focused."""
     try:
+        if client.focused_window_class():
+            return
         user.focus_window_by_name("Workspace")
-        time.sleep(0.3)
+        wait_until(client.focused_window_class, timeout=1.0)
     except:
         pass
 
@@ -50,19 +48,13 @@ def ensure_viewer_window():
         time.sleep(0.5)
     elif count > 1:
         # Close extras
-        for _ in range(count - 1):
-            user.cmd('w')
-            time.sleep(0.3)
+        client.close_window_by_class('GWViewerWindow', count - 1)
     
     return count_viewer_windows() >= 1
 
 def get_viewer_window_info():
     """Get info about the first visible viewer window."""
-    visible = client.get_visible_windows()
-    for w in visible:
-        if w.get('class') == 'GWViewerWindow':
-            return w
-    return None
+    return client.first_of_class('GWViewerWindow')
 
 
 # ============== Window Management Tests ==============
@@ -78,8 +70,7 @@ def test_open_new_viewer():
     
     # Clean up
     if count_after > count_before:
-        user.cmd('w')
-        time.sleep(0.3)
+        client.close_window_by_class('GWViewerWindow')
     
     return count_after > count_before
 
@@ -111,15 +102,14 @@ def test_multiple_viewers():
     count = count_viewer_windows()
     
     # Clean up - close 2
-    for _ in range(2):
-        user.cmd('w')
-        time.sleep(0.3)
+    client.close_window_by_class('GWViewerWindow', 2)
     
     return count >= 3
 
 
 # ============== View Type Tests ==============
 
+@readonly
 def test_view_menu_items_exist():
     """View menu has view type items."""
     try:
@@ -147,6 +137,7 @@ def test_switch_to_icon_view():
     count = client.count_elements_by_class('FSNIcon')
     return count > 0
 
+@cacheable_smoke(client)
 def test_switch_to_list_view():
     """Switch to List view with Cmd+2."""
     activate_workspace()
@@ -214,16 +205,8 @@ def test_click_in_viewer():
     if not w:
         return False
     
-    frame = w.get('frame', {})
-    if not frame:
-        # Try clicking in center of screen
-        x = SCREEN_WIDTH // 2
-        y = SCREEN_HEIGHT // 2
-    else:
-        # Click in center of viewer
-        x = int(frame.get('x', 400) + frame.get('width', 600) / 2)
-        y = int(frame.get('y', 200) + frame.get('height', 400) / 2)
-    
+    # Click in center of viewer
+    x, y = center_of(w)
     user.click_smooth(x, y)
     time.sleep(0.3)
     
@@ -242,14 +225,10 @@ def test_double_click_to_open():
     if not w:
         return False
     
-    frame = w.get('frame', {})
-    if frame:
-        # Click on an icon (assuming icon view, top-left area)
-        x = int(frame.get('x', 400) + 80)
-        y = int(frame.get('y', 200) + 100)
-        
-        user.double_click_smooth(x, y)
-        time.sleep(0.5)
+    # Click on an icon (assuming icon view fills the viewer)
+    x, y = center_of(w)
+    user.double_click_smooth(x, y)
+    time.sleep(0.5)
     
     return True
 
@@ -265,17 +244,13 @@ def test_right_click_context_menu():
     if not w:
         return False
     
-    frame = w.get('frame', {})
-    if frame:
-        x = int(frame.get('x', 400) + 200)
-        y = int(frame.get('y', 200) + 200)
-        
-        user.right_click_smooth(x, y)
-        time.sleep(0.5)
-        
-        # Dismiss menu
-        user.press_escape()
-        time.sleep(0.2)
+    x, y = center_of(w)
+    user.right_click_smooth(x, y)
+    time.sleep(0.5)
+    
+    # Dismiss menu
+    user.press_escape()
+    time.sleep(0.2)
     
     return True
 
@@ -291,19 +266,14 @@ def test_drag_selection():
     if not w:
         return False
     
-    frame = w.get('frame', {})
-    if frame:
-        x1 = int(frame.get('x', 400) + 50)
-        y1 = int(frame.get('y', 200) + 50)
-        x2 = int(frame.get('x', 400) + 200)
-        y2 = int(frame.get('y', 200) + 200)
-        
-        user.drag_smooth(x1, y1, x2, y2)
-        time.sleep(0.3)
-        
-        # Click elsewhere to deselect
-        user.click(x1 - 30, y1 - 30)
-        time.sleep(0.2)
+    x1, y1 = center_of(w, -75, -75)
+    x2, y2 = center_of(w, 75, 75)
+    user.drag_smooth(x1, y1, x2, y2)
+    time.sleep(0.3)
+    
+    # Click elsewhere to deselect
+    user.click(x1 - 30, y1 - 30)
+    time.sleep(0.2)
     
     return True
 
@@ -316,6 +286,7 @@ def test_viewer_has_shelf():
     count = client.count_elements_by_class('GWViewerShelf')
     return count > 0
 
+@cacheable_smoke(client)
 def test_shelf_drag_drop():
     """Drag icon to shelf."""
     activate_workspace()
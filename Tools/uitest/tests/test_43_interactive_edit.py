@@ -14,28 +14,27 @@ import time
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python'))
 
-from uitest import WorkspaceTestClient, run_tests
-from user_input import UserInput
+from uitest import UITestException, cacheable_smoke, readonly, run_tests, wait_until
+from test_utils import get_client, get_user
 
-# Initialize
-client = WorkspaceTestClient()
-user = UserInput()
+# Shared with the other suites when collected together by pytest
+client = get_client()
+user = get_user()
 
 
 def activate_workspace():
     """Ensure Workspace is focused."""
     try:
+        if client.focused_window_class():
+            return
         user.focus_window_by_name("Workspace")
-        time.sleep(0.3)
+        wait_until(client.focused_window_class, timeout=1.0)
     except:
         pass
 
 def ensure_viewer_window():
     """Make sure we have a viewer window open."""
-    visible = client.get_visible_windows()
-    has_viewer = any(w.get('class') == 'GWViewerWindow' for w in visible)
-    
-    if not has_viewer:
+    if client.first_of_class('GWViewerWindow') is None:
         user.cmd('n')  # Open new viewer
         time.sleep(0.5)
     return True
@@ -43,46 +42,54 @@ def ensure_viewer_window():
 
 # ============== Menu State Tests ==============
 
+EDIT_MENU_EXPECTED = ('Undo', 'Redo', 'Cut', 'Copy', 'Paste', 'Select All')
+
+def edit_menu_item(title):
+    """Look up an Edit menu item by title in the client's menu cache."""
+    try:
+        return client.get_menu_item('Edit', title)
+    except UITestException:
+        return {}
+
+@readonly
 def test_edit_menu_items():
     """Edit menu has expected items."""
-    items = client.get_menu_items('Edit')
-    titles = [i.get('title', '') for i in items if not i.get('separator')]
-    
-    expected = ['Undo', 'Redo', 'Cut', 'Copy', 'Paste', 'Select All']
-    for exp in expected:
-        if exp not in titles:
-            print(f"  Missing: {exp}")
-            return False
-    return True
+    missing = {t for t in EDIT_MENU_EXPECTED if not edit_menu_item(t)}
+    if missing:
+        print(f"  Missing: {', '.join(sorted(missing))}")
+    return not missing
 
+@readonly
 def test_undo_available():
     """Undo menu item exists."""
-    item = client.get_menu_item('Edit', 'Undo')
-    return item.get('action') == 'undo:'
+    return edit_menu_item('Undo').get('action') == 'undo:'
 
+@readonly
 def test_redo_available():
     """Redo menu item exists."""
-    item = client.get_menu_item('Edit', 'Redo')
-    return item.get('action') == 'redo:'
+    return edit_menu_item('Redo').get('action') == 'redo:'
 
+@readonly
 def test_cut_available():
     """Cut menu item exists."""
-    item = client.get_menu_item('Edit', 'Cut')
-    return item.get('action') == 'cut:'
+    return edit_menu_item('Cut').get('action') == 'cut:'
 
+@readonly
 def test_copy_available():
     """Copy menu item exists."""
-    item = client.get_menu_item('Edit', 'Copy')
-    return item.get('action') == 'copy:'
+    return edit_menu_item('Copy').get('action') == 'copy:'
 
+@readonly
 def test_paste_disabled_when_empty():
     """Paste is disabled when clipboard is empty."""
-    # Paste should be disabled if nothing to paste
+    # Paste should be disabled if nothing to paste; the cached item's
+    # enabled flag may be stale, so ask for the live state
     return not client.is_menu_item_enabled('Edit', 'Paste')
 
 
 # ============== Keyboard Shortcut Tests ==============
 
+@cacheable_smoke(client)
 def test_shortcut_undo():
     """Undo shortcut Cmd+Z."""
     activate_workspace()
@@ -94,6 +101,7 @@ def test_shortcut_undo():
     # No visible change expected, just verifying no crash
     return True
 
+@cacheable_smoke(client)
 def test_shortcut_redo():
     """Redo shortcut Cmd+Shift+Z."""
     activate_workspace()
@@ -131,6 +139,7 @@ def test_shortcut_copy():
     
     return True
 
+@cacheable_smoke(client)
 def test_shortcut_paste():
     """Paste shortcut Cmd+V."""
     activate_workspace()
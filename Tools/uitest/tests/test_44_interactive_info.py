@@ -11,51 +11,44 @@ Tests the Info/Inspector panel:
 import sys
 import os
 import time
+from functools import lru_cache
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python'))
 
-from uitest import WorkspaceTestClient, run_tests
-from user_input import UserInput
+from uitest import readonly, run_tests, wait_until
+from test_utils import get_client, get_user
 
-# Initialize
-client = WorkspaceTestClient()
-user = UserInput()
+# Shared with the other suites when collected together by pytest
+client = get_client()
+user = get_user()
 
 
 def activate_workspace():
     """Ensure Workspace is focused."""
     try:
+        if client.focused_window_class():
+            return
         user.focus_window_by_name("Workspace")
-        time.sleep(0.3)
+        wait_until(client.focused_window_class, timeout=1.0)
     except:
         pass
 
 def ensure_viewer_window():
     """Make sure we have a viewer window open."""
-    visible = client.get_visible_windows()
-    has_viewer = any(w.get('class') == 'GWViewerWindow' for w in visible)
-    
-    if not has_viewer:
+    if client.first_of_class('GWViewerWindow') is None:
         user.cmd('n')
         time.sleep(0.5)
     return True
 
-def close_info_panel():
-    """Close the Info panel if open."""
-    if client.window_exists('Info'):
-        # Focus and close
-        user.focus_window_by_name('Info')
-        time.sleep(0.2)
-        user.cmd('w')
-        time.sleep(0.3)
-
 
 # ============== Basic Info Panel Tests ==============
 
+@readonly
 def test_get_info_enabled():
     """Get Info menu item is enabled."""
     return client.is_menu_item_enabled('File', 'Get Info')
 
+@readonly
 def test_get_info_shortcut():
     """Get Info has Cmd+I shortcut."""
     item = client.get_menu_item('File', 'Get Info')
@@ -74,7 +67,7 @@ def test_open_info_with_shortcut():
     time.sleep(0.5)
     
     result = client.window_exists('Info')
-    close_info_panel()
+    client.close_window_and_wait('Info')
     return result
 
 def test_open_info_for_applications():
@@ -89,83 +82,56 @@ def test_open_info_for_applications():
     time.sleep(0.5)
     
     result = client.window_exists('Info')
-    close_info_panel()
+    client.close_window_and_wait('Info')
     return result
 
 
 # ============== Info Panel Content Tests ==============
 
-def test_info_shows_title():
-    """Info panel shows item title."""
+@lru_cache(maxsize=1)
+def home_info():
+    """
+    Open Info for the Home folder, read it once and close it again.
+    
+    Returns:
+        Tuple of (visible texts, info panel fields); both empty if the
+        panel did not open
+    """
     activate_workspace()
     ensure_viewer_window()
     
-    user.cmd_shift('h')  # Home
+    user.cmd_shift('h')  # Home - path should contain "home" or username
     time.sleep(0.5)
     
     user.cmd('i')
-    time.sleep(0.5)
-    
-    # Info panel should show something about the path
-    result = client.window_exists('Info')
-    close_info_panel()
-    return result
+    try:
+        if not wait_until(lambda: client.window_exists('Info'), timeout=1.0):
+            return (), {}
+        return (tuple(client.get_visible_text_in_window('Info')),
+                client.get_info_panel())
+    finally:
+        client.close_window_and_wait('Info')
+
+def test_info_shows_title():
+    """Info panel shows item title."""
+    texts, _ = home_info()
+    return bool(texts)
 
 def test_info_shows_path():
     """Info panel shows file path."""
-    activate_workspace()
-    ensure_viewer_window()
-    
-    user.cmd_shift('h')  # Home - path should contain "home" or username
-    time.sleep(0.5)
-    
-    user.cmd('i')
-    time.sleep(0.5)
-    
-    # Check for path-like content
-    texts = client.get_visible_text_in_window('Info')
-    result = any('/' in t for t in texts)
-    
-    close_info_panel()
-    return result
+    texts, _ = home_info()
+    return any('/' in t for t in texts)
 
 def test_info_shows_size():
     """Info panel shows size information."""
-    activate_workspace()
-    ensure_viewer_window()
-    
-    user.cmd_shift('h')  # Home
-    time.sleep(0.5)
-    
-    user.cmd('i')
-    time.sleep(0.5)
-    
-    # Look for size-related text
-    texts = client.get_visible_text_in_window('Info')
-    result = any('Size' in t or 'bytes' in t.lower() or 'KB' in t or 'MB' in t 
-                 for t in texts)
-    
-    close_info_panel()
-    return result
+    _, fields = home_info()
+    return 'size' in fields
 
 def test_info_shows_dates():
     """Info panel shows modification/creation dates."""
-    activate_workspace()
-    ensure_viewer_window()
-    
-    user.cmd_shift('h')
-    time.sleep(0.5)
-    
-    user.cmd('i')
-    time.sleep(0.5)
-    
-    # Look for date-related text
-    texts = client.get_visible_text_in_window('Info')
-    result = any('Modified' in t or 'Created' in t or 'Date' in t 
-                 for t in texts)
-    
-    close_info_panel()
-    return result
+    # Dates are shown in the "Changed" box
+    _, fields = home_info()
+    return 'changed' in fields
 
 
 # ============== About Panel Tests ==============
@@ -178,7 +144,7 @@ def test_about_opens():
     time.sleep(0.5)
     
     result = client.window_exists('Info')
-    close_info_panel()
+    client.close_window_and_wait('Info')
     return result
 
 def test_about_shows_version():
@@ -190,7 +156,7 @@ def test_about_shows_version():
     texts = client.get_visible_text_in_window('Info')
     result = any('Release:' in t or 'Version' in t for t in texts)
     
-    close_info_panel()
+    client.close_window_and_wait('Info')
     return result
 
 def test_about_shows_authors():
@@ -200,7 +166,7 @@ def test_about_shows_authors():
     time.sleep(0.5)
     
     result = client.text_visible('Authors:')
-    close_info_panel()
+    client.close_window_and_wait('Info')
     return result
 
 
@@ -224,7 +190,7 @@ def test_info_panel_updates():
     # Info should update (or we can check content changed)
     result = client.window_exists('Info')
     
-    close_info_panel()
+    client.close_window_and_wait('Info')
     return result
 
 
@@ -261,11 +227,11 @@ if __name__ == "__main__":
     print("="*60 + "\n")
     
     # Clean up any existing Info panels
-    close_info_panel()
+    client.close_window_and_wait('Info')
     
     result = run_tests(*tests)
     
     # Cleanup
-    close_info_panel()
+    client.close_window_and_wait('Info')
     
     exit(result)
@@ -15,37 +15,33 @@ import time
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python'))
 
-from uitest import WorkspaceTestClient, run_tests
-from user_input import UserInput
+from uitest import readonly, run_tests, wait_until
+from test_utils import get_client, get_user
 
-# Initialize
-client = WorkspaceTestClient()
-user = UserInput()
+# Shared with the other suites when collected together by pytest
+client = get_client()
+user = get_user()
 
 
 def activate_workspace():
     """Ensure Workspace is focused."""
     try:
+        if client.focused_window_class():
+            return
         user.focus_window_by_name("Workspace")
-        time.sleep(0.3)
+        wait_until(client.focused_window_class, timeout=1.0)
     except:
         pass
 
-def close_finder():
-    """Close Finder window if open."""
-    if client.window_exists('Finder'):
-        user.focus_window_by_name('Finder')
-        time.sleep(0.2)
-        user.cmd('w')
-        time.sleep(0.3)
-
 
 # ============== Menu Tests ==============
 
+@readonly
 def test_find_menu_enabled():
     """Find menu item is enabled."""
     return client.is_menu_item_enabled('File', 'Find')
 
+@readonly
 def test_find_shortcut():
     """Find has Cmd+F shortcut."""
     item = client.get_menu_item('File', 'Find')
@@ -57,7 +53,7 @@ def test_find_shortcut():
 def test_open_finder_shortcut():
     """Open Finder with Cmd+F."""
     activate_workspace()
-    close_finder()
+    client.close_window_and_wait('Finder')
     
     user.cmd('f')
     time.sleep(0.5)
@@ -88,14 +84,14 @@ def test_type_in_finder():
         user.cmd('f')
         time.sleep(0.5)
     
+    # Goes through the keyboard like a user would, unlike set_text_field
     user.focus_window_by_name('Finder')
-    time.sleep(0.3)
-    
-    # Type a search term
-    user.type_text('Applications')
-    time.sleep(0.3)
+    user.paste_text('Applications')
     
-    return True
+    return wait_until(
+        lambda: any('Applications' in t
+                    for t in client.get_visible_text_in_window('Finder')),
+        timeout=1.0)
 
 def test_search_and_clear():
     """Type search, then clear."""
@@ -105,26 +101,10 @@ def test_search_and_clear():
         user.cmd('f')
         time.sleep(0.5)
     
-    user.focus_window_by_name('Finder')
-    time.sleep(0.3)
-    
-    # Clear any existing text
-    user.cmd('a')
-    time.sleep(0.1)
-    user.press_delete()
-    time.sleep(0.2)
-    
-    # Type something
-    user.type_text('test')
-    time.sleep(0.3)
-    
-    # Clear it
-    user.cmd('a')
-    time.sleep(0.1)
-    user.press_delete()
-    time.sleep(0.2)
+    typed = client.set_text_field('Finder', 'test')
+    cleared = client.set_text_field('Finder', '')
     
-    return True
+    return typed.get('value') == 'test' and cleared.get('value') == ''
 
 def test_search_with_enter():
     """Type search and press Enter."""
@@ -134,20 +114,9 @@ def test_search_with_enter():
         user.cmd('f')
         time.sleep(0.5)
     
-    user.focus_window_by_name('Finder')
-    time.sleep(0.3)
-    
-    user.cmd('a')
-    time.sleep(0.1)
-    user.press_delete()
-    time.sleep(0.2)
-    
-    user.type_text('Workspace')
-    time.sleep(0.3)
-    user.press_return()
-    time.sleep(0.5)
-    
-    return True
+    # set_text_field sends the field's action, same as pressing Return
+    result = client.set_text_field('Finder', 'Workspace')
+    return result.get('success', False)
 
 
 # ============== Finder Window Tests ==============
@@ -161,7 +130,7 @@ def test_finder_close_with_escape():
         time.sleep(0.5)
     
     user.focus_window_by_name('Finder')
-    time.sleep(0.3)
+    client.wait_until_focused('Finder')
     
     user.press_escape()
     time.sleep(0.3)
@@ -179,7 +148,7 @@ def test_finder_close_with_cmd_w():
         time.sleep(0.5)
     
     user.focus_window_by_name('Finder')
-    time.sleep(0.3)
+    client.wait_until_focused('Finder')
     
     user.cmd('w')
     time.sleep(0.5)
@@ -192,7 +161,7 @@ def test_reopen_finder():
     activate_workspace()
     
     # Close if open
-    close_finder()
+    client.close_window_and_wait('Finder')
     
     # Open
     user.cmd('f')
@@ -233,6 +202,6 @@ if __name__ == "__main__":
     result = run_tests(*tests)
     
     # Cleanup
-    close_finder()
+    client.close_window_and_wait('Finder')
     
     exit(result)
@@ -14,37 +14,55 @@ import time
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python'))
 
-from uitest import WorkspaceTestClient, run_tests
-from user_input import UserInput
+from uitest import readonly, run_tests, wait_until
+from test_utils import get_client, get_user
 
-# Initialize
-client = WorkspaceTestClient()
-user = UserInput()
+# Shared with the other suites when collected together by pytest
+client = get_client()
+user = get_user()
 
 
 def activate_workspace():
     """Ensure Workspace is focused."""
     try:
+        if client.focused_window_class():
+            return
         user.focus_window_by_name("Workspace")
-        time.sleep(0.3)
+        wait_until(client.focused_window_class, timeout=1.0)
     except:
         pass
 
 def close_preferences():
     """Close Preferences window if open."""
-    if client.window_exists('Workspace Preferences'):
+    result = client.close_window('Workspace Preferences')
+    if result.get('success'):
+        client.wait_for_window_gone('Workspace Preferences', 1.0)
+    elif (result.get('error') == 'Window not found'
+            and client.window_exists('Workspace Preferences')):
+        # close-window missed a window the UI state still lists: close it
+        # like a user
         user.focus_window_by_name('Workspace Preferences')
         time.sleep(0.2)
         user.cmd('w')
-        time.sleep(0.3)
+        client.wait_for_window_gone('Workspace Preferences', 1.0)
+
+def ensure_prefs_open():
+    """Open Preferences with Cmd+, unless it is already open."""
+    if client.window_exists('Workspace Preferences'):
+        return True
+    activate_workspace()
+    user.cmd('comma')
+    return client.wait_for_window_open('Workspace Preferences')
 
 
 # ============== Menu Tests ==============
 
+@readonly
 def test_preferences_menu_enabled():
     """Preferences menu item is enabled."""
     return client.is_menu_item_enabled('Workspace', 'Preferences...')
 
+@readonly
 def test_preferences_shortcut():
     """Preferences has Cmd+, shortcut."""
     item = client.get_menu_item('Workspace', 'Preferences...')
@@ -59,55 +77,39 @@ def test_open_preferences_shortcut():
     close_preferences()
     
     user.cmd('comma')
-    time.sleep(0.5)
-    
-    result = client.window_exists('Workspace Preferences')
-    return result
+    return client.wait_for_window_open('Workspace Preferences')
+
+
+# ============== Content Tests ==============
+
+# Each opens Preferences if needed; when run in order it is already open
+# from test_open_preferences_shortcut, and test_close_preferences_shortcut
+# closes it again.
 
 def test_preferences_has_content():
     """Preferences window has content."""
-    activate_workspace()
-    
-    if not client.window_exists('Workspace Preferences'):
-        user.cmd('comma')
-        time.sleep(0.5)
-    
+    ensure_prefs_open()
     # Should have some preferences UI
-    texts = client.get_visible_text_in_window('Workspace Preferences')
-    return len(texts) > 0
-
-
-# ============== Preference Pane Tests ==============
+    return len(client.get_visible_text_in_window('Workspace Preferences')) > 0
 
 def test_preferences_has_icons():
     """Preferences has toolbar icons."""
-    activate_workspace()
-    
-    if not client.window_exists('Workspace Preferences'):
-        user.cmd('comma')
-        time.sleep(0.5)
-    
+    ensure_prefs_open()
     # Look for icons or toolbar
-    icons = client.count_elements_by_class('NSImageView')
-    buttons = client.count_elements_by_class('NSButton')
-    
-    return icons > 0 or buttons > 0
+    counts = client.element_class_counts('Workspace Preferences')
+    return counts['NSImageView'] > 0 or counts['NSButton'] > 0
 
 def test_click_preference_pane():
     """Click on a preference pane."""
-    activate_workspace()
-    
-    if not client.window_exists('Workspace Preferences'):
-        user.cmd('comma')
-        time.sleep(0.5)
+    ensure_prefs_open()
     
     user.focus_window_by_name('Workspace Preferences')
-    time.sleep(0.3)
+    client.wait_until_focused('Workspace Preferences')
     
     # Click somewhere in the preferences window
     # Typically preference icons are in a toolbar at top
-    user.click_smooth(200, 100)
-    time.sleep(0.5)
+    user.click(200, 100)
+    time.sleep(0.05)
     
     return True
 
@@ -116,19 +118,13 @@ def test_click_preference_pane():
 
 def test_close_preferences_shortcut():
     """Close Preferences with Cmd+W."""
-    activate_workspace()
-    
-    if not client.window_exists('Workspace Preferences'):
-        user.cmd('comma')
-        time.sleep(0.5)
+    ensure_prefs_open()
     
     user.focus_window_by_name('Workspace Preferences')
-    time.sleep(0.3)
+    client.wait_until_focused('Workspace Preferences')
     
     user.cmd('w')
-    time.sleep(0.5)
-    
-    return not client.window_exists('Workspace Preferences')
+    return client.wait_for_window_gone('Workspace Preferences')
 
 def test_reopen_preferences():
     """Close and reopen Preferences."""
@@ -136,9 +132,8 @@ def test_reopen_preferences():
     close_preferences()
     
     user.cmd('comma')
-    time.sleep(0.5)
-    
-    result = client.window_exists('Workspace Preferences')
+    # Same bound as the old fixed 0.5 s sleep, but returns on appearance
+    result = client.wait_for_window_open('Workspace Preferences', 0.5, interval=0.02)
     close_preferences()
     return result
 
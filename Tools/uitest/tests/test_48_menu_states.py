@@ -10,46 +10,64 @@ Uses the list-menus capability to inspect menu state without clicking.
 
 import sys
 import os
-import time
+import threading
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python'))
 
-from uitest import WorkspaceTestClient, run_tests
-from user_input import UserInput
+from uitest import WorkspaceTestClient, UITestException, run_tests_parallel
 
 # Initialize
 client = WorkspaceTestClient()
-user = UserInput()
 
 
-def activate_workspace():
-    """Ensure Workspace is focused."""
+# ============== Menu Snapshot ==============
+
+_menus = None
+_menus_lock = threading.Lock()
+
+def menus():
+    """All menu items by menu and item title, fetched once for the suite."""
+    global _menus
+    with _menus_lock:
+        if _menus is None:
+            state = client.get_menu_state()
+            _menus = {
+                m.get('title'): {i.get('title'): i for i in m.get('items', [])
+                                 if not i.get('separator')}
+                for m in state.get('menus', [])
+            }
+        return _menus
+
+def menu_item(menu_title, item_title):
+    """Look up a menu item in the snapshot."""
     try:
-        user.focus_window_by_name("Workspace")
-        time.sleep(0.3)
-    except:
-        pass
+        return menus()[menu_title][item_title]
+    except KeyError:
+        raise UITestException(f"Menu item not found: {menu_title} > {item_title}")
+
+def item_enabled(menu_title, item_title):
+    """Whether a menu item was enabled when the snapshot was taken."""
+    return menu_item(menu_title, item_title).get('enabled', False)
 
 
 # ============== Menu State API Tests ==============
 
 def test_list_menus_available():
     """The list-menus API is available."""
+    # Deliberately bypasses the snapshot to exercise the round trip
     state = client.get_menu_state()
     return state.get('success', False)
 
 def test_all_menus_present():
     """All expected menus are present."""
-    state = client.get_menu_state()
-    menus = state.get('menus', [])
-    menu_names = [m.get('title') for m in menus]
+    menu_names = set(menus())
     
     expected = ['Workspace', 'File', 'Edit', 'View', 'Go', 'Tools', 'Window', 'Help']
     
-    for exp in expected:
-        if exp not in menu_names:
-            print(f"  Missing menu: {exp}")
-            return False
+    missing = [exp for exp in expected if exp not in menu_names]
+    if missing:
+        print(f"  Missing menu: {', '.join(missing)}")
+        return False
     return True
 
 
@@ -57,51 +75,51 @@ def test_all_menus_present():
 
 def test_workspace_about_enabled():
     """About Workspace is enabled."""
-    return client.is_menu_item_enabled('Workspace', 'About Workspace')
+    return item_enabled('Workspace', 'About Workspace')
 
 def test_workspace_preferences_enabled():
     """Preferences is enabled."""
-    return client.is_menu_item_enabled('Workspace', 'Preferences...')
+    return item_enabled('Workspace', 'Preferences...')
 
 def test_workspace_hide_enabled():
     """Hide Workspace is enabled."""
-    return client.is_menu_item_enabled('Workspace', 'Hide Workspace')
+    return item_enabled('Workspace', 'Hide Workspace')
 
 def test_workspace_logout_enabled():
     """Logout is enabled."""
-    return client.is_menu_item_enabled('Workspace', 'Logout')
+    return item_enabled('Workspace', 'Logout')
 
 
 # ============== File Menu Tests ==============
 
 def test_file_new_window_enabled():
     """New Workspace Window is enabled."""
-    return client.is_menu_item_enabled('File', 'New Workspace Window')
+    return item_enabled('File', 'New Workspace Window')
 
 def test_file_new_folder_disabled():
     """New Folder is disabled (not implemented)."""
-    return not client.is_menu_item_enabled('File', 'New Folder')
+    return not item_enabled('File', 'New Folder')
 
 def test_file_open_enabled():
     """Open is enabled."""
-    return client.is_menu_item_enabled('File', 'Open')
+    return item_enabled('File', 'Open')
 
 def test_file_close_enabled():
     """Close Window is enabled."""
-    return client.is_menu_item_enabled('File', 'Close Window')
+    return item_enabled('File', 'Close Window')
 
 def test_file_get_info_enabled():
     """Get Info is enabled."""
-    return client.is_menu_item_enabled('File', 'Get Info')
+    return item_enabled('File', 'Get Info')
 
 def test_file_find_enabled():
     """Find is enabled."""
-    return client.is_menu_item_enabled('File', 'Find')
+    return item_enabled('File', 'Find')
 
 def test_file_duplicate_state():
     """Duplicate state is contextual."""
     # Duplicate should be disabled when nothing is selected
-    item = client.get_menu_item('File', 'Duplicate')
+    item = menu_item('File', 'Duplicate')
     return item is not None  # Item exists
 
 
@@ -109,15 +127,15 @@ def test_file_duplicate_state():
 
 def test_edit_undo_enabled():
     """Undo is enabled."""
-    return client.is_menu_item_enabled('Edit', 'Undo')
+    return item_enabled('Edit', 'Undo')
 
 def test_edit_copy_enabled():
     """Copy is enabled."""
-    return client.is_menu_item_enabled('Edit', 'Copy')
+    return item_enabled('Edit', 'Copy')
 
 def test_edit_paste_state():
     """Paste state depends on clipboard."""
-    item = client.get_menu_item('Edit', 'Paste')
+    item = menu_item('Edit', 'Paste')
     return item is not None
 
 
@@ -125,98 +143,102 @@ def test_edit_paste_state():
 
 def test_view_as_icons_exists():
     """as Icons view exists."""
-    item = client.get_menu_item('View', 'as Icons')
+    item = menu_item('View', 'as Icons')
     return item.get('action') == 'setViewerType:'
 
 def test_view_as_list_exists():
     """as List view exists."""
-    item = client.get_menu_item('View', 'as List')
+    item = menu_item('View', 'as List')
     return item.get('action') == 'setViewerType:'
 
 def test_view_as_columns_exists():
     """as Columns view exists."""
-    item = client.get_menu_item('View', 'as Columns')
+    item = menu_item('View', 'as Columns')
     return item.get('action') == 'setViewerType:'
 
 def test_view_fullscreen_enabled():
     """Enter Full Screen is enabled."""
-    return client.is_menu_item_enabled('View', 'Enter Full Screen')
+    return item_enabled('View', 'Enter Full Screen')
 
 
 # ============== Go Menu Tests ==============
 
 def test_go_back_enabled():
     """Back is enabled."""
-    return client.is_menu_item_enabled('Go', 'Back')
+    return item_enabled('Go', 'Back')
 
 def test_go_forward_enabled():
     """Forward is enabled."""
-    return client.is_menu_item_enabled('Go', 'Forward')
+    return item_enabled('Go', 'Forward')
 
 def test_go_home_enabled():
     """Home is enabled."""
-    return client.is_menu_item_enabled('Go', 'Home')
+    return item_enabled('Go', 'Home')
 
 def test_go_computer_enabled():
     """Computer is enabled."""
-    return client.is_menu_item_enabled('Go', 'Computer')
+    return item_enabled('Go', 'Computer')
 
 def test_go_applications_enabled():
     """Applications is enabled."""
-    return client.is_menu_item_enabled('Go', 'Applications')
+    return item_enabled('Go', 'Applications')
 
 def test_go_to_folder_enabled():
     """Go to Folder is enabled."""
-    return client.is_menu_item_enabled('Go', 'Go to Folder...')
+    return item_enabled('Go', 'Go to Folder...')
 
 
 # ============== Tools Menu Tests ==============
 
 def test_tools_run_enabled():
     """Run... is enabled."""
-    return client.is_menu_item_enabled('Tools', 'Run...')
+    return item_enabled('Tools', 'Run...')
 
 
 # ============== Window Menu Tests ==============
 
 def test_window_minimize_state():
     """Minimize exists."""
-    item = client.get_menu_item('Window', 'Minimize')
+    item = menu_item('Window', 'Minimize')
     return item is not None
 
 def test_window_bring_all_enabled():
     """Bring All to Front is enabled."""
-    return client.is_menu_item_enabled('Window', 'Bring All to Front')
+    return item_enabled('Window', 'Bring All to Front')
 
 
 # ============== Help Menu Tests ==============
 
 def test_help_workspace_help_enabled():
     """Workspace Help is enabled."""
-    return client.is_menu_item_enabled('Help', 'Workspace Help')
+    return item_enabled('Help', 'Workspace Help')
 
 
 # ============== Summary Report ==============
 
-def test_generate_report():
-    """Generate summary of enabled/disabled items."""
+def emit_report():
+    """Print a summary of enabled/disabled items from the snapshot."""
     print("\n  --- Menu State Summary ---")
     
-    enabled = client.get_enabled_menu_items()
-    disabled = client.get_disabled_menu_items()
+    try:
+        snapshot = menus()
+    except UITestException as e:
+        print(f"\n  Menu state unavailable: {e}")
+        return
+    
+    items = [(menu, item) for menu, entries in snapshot.items()
+             for item in entries.values()]
+    disabled = [(menu, item) for menu, item in items if not item.get('enabled')]
     
-    print(f"\n  Enabled items: {len(enabled)}")
+    print(f"\n  Enabled items: {len(items) - len(disabled)}")
     print(f"  Disabled items: {len(disabled)}")
     
     if disabled:
         print("\n  Disabled items:")
-        for item in disabled:
-            menu = item.get('menu', '?')
+        for menu, item in disabled:
             title = item.get('title', '?')
             action = item.get('action', 'no action')
             print(f"    {menu} > {title} ({action})")
-    
-    return True
 
 
 # ============== Test Suite ==============
@@ -269,9 +291,6 @@ tests = [
     
     # Help menu
     ("Help > Workspace Help enabled", test_help_workspace_help_enabled),
-    
-    # Summary
-    ("Generate state report", test_generate_report),
 ]
 
 if __name__ == "__main__":
@@ -279,4 +298,9 @@ if __name__ == "__main__":
     print("MENU STATE VERIFICATION")
     print("Tests which menu items are enabled/disabled")
     print("="*60 + "\n")
-    exit(run_tests(*tests))
+    # Every test is a menu-state lookup, so they can all run at once
+    result = run_tests_parallel(*tests)
+    
+    emit_report()
+    
+    exit(result)
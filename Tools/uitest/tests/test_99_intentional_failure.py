@@ -18,9 +18,6 @@ from uitest import WorkspaceTestClient, run_tests
 
 client = WorkspaceTestClient()
 
-# Open About dialog for visible failure
-client.open_about_dialog()
-
 def always_fails():
     """This test always fails for demonstration."""
     return False
@@ -43,4 +40,8 @@ if __name__ == "__main__":
     print("NOTE: These tests are EXPECTED to fail!")
     print("They demonstrate the failure detection and highlighting.")
     print("="*60 + "\n")
+    
+    # Open About dialog for visible failure
+    client.open_about_dialog()
+    
     exit(run_tests(*tests))
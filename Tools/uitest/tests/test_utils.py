@@ -17,61 +17,84 @@ import sys
 import os
 import time
 import traceback
-from typing import Optional, Dict, Any, Callable
-from functools import wraps
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, List, Tuple, Union
+from functools import lru_cache, wraps
+from operator import itemgetter
 
 # Add python directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python'))
 
-from uitest import WorkspaceTestClient
-from user_input import UserInput
-from modal_handler import ModalHandler, get_handler, check_before_click
-from test_failure_capture import FailureCapture, get_capture, on_test_failure
+from uitest import WorkspaceTestClient, wait_until
 
-# Global instances
-_client = None
-_user = None
-_modal_handler = None
-_failure_capture = None
+# Input, modal and capture helpers are imported by their get_*() factories
+# on first use; a clean run never needs the failure capture at all
+if TYPE_CHECKING:
+    from user_input import UserInput
+    from modal_handler import ModalHandler, WindowInfo
+    from test_failure_capture import FailureCapture
 
+# Fixed pause after an action with nothing specific to wait for; lower it
+# with UITEST_SETTLE_MS on a fast machine
+SETTLE_MS = int(os.environ.get('UITEST_SETTLE_MS', '150'))
 
+
+def _settle(predicate: Optional[Callable[[], Any]] = None,
+            timeout: Optional[float] = None) -> bool:
+    """
+    Let the UI catch up after an input action.
+    
+    With a predicate, poll it until true or timeout seconds (default 1)
+    pass; otherwise sleep SETTLE_MS.
+    
+    Returns:
+        True once settled, False if the predicate timed out
+    """
+    if predicate is None:
+        time.sleep(SETTLE_MS / 1000)
+        return True
+    return wait_until(predicate, 1.0 if timeout is None else timeout, 0.02)
+
+
+# Each get_*() builds its instance on first call and returns it after
+
+@lru_cache(maxsize=1)
 def get_client() -> WorkspaceTestClient:
     """Get or create the WorkspaceTestClient instance."""
-    global _client
-    if _client is None:
-        _client = WorkspaceTestClient()
-    return _client
+    return WorkspaceTestClient()
 
 
-def get_user() -> UserInput:
+@lru_cache(maxsize=1)
+def get_user() -> "UserInput":
     """Get or create the UserInput instance."""
-    global _user
-    if _user is None:
-        _user = UserInput()
-    return _user
+    from user_input import UserInput
+    user = UserInput()
+    # Input can open, close or refocus windows
+    user.add_input_listener(get_client().invalidate_windows_cache)
+    # Menu item state follows the key window
+    user.add_focus_listener(get_client().invalidate_menu_cache)
+    return user
 
 
-def get_modal_handler() -> ModalHandler:
+@lru_cache(maxsize=1)
+def get_modal_handler() -> "ModalHandler":
     """Get or create the ModalHandler instance (non-blocking)."""
-    global _modal_handler
-    if _modal_handler is None:
-        _modal_handler = ModalHandler()
-    return _modal_handler
+    from modal_handler import ModalHandler
+    return ModalHandler()
 
 
-def get_failure_capture() -> FailureCapture:
+@lru_cache(maxsize=1)
+def get_failure_capture() -> "FailureCapture":
     """Get or create the FailureCapture instance."""
-    global _failure_capture
-    if _failure_capture is None:
-        _failure_capture = FailureCapture("/tmp/uitest_failures")
-    return _failure_capture
+    from test_failure_capture import FailureCapture
+    return FailureCapture("/tmp/uitest_failures")
 
 
 def activate_workspace():
     """Ensure Workspace is focused."""
     handler = get_modal_handler()
     handler.ensure_workspace_focused()
-    time.sleep(0.2)
+    _settle()
 
 
 def dismiss_all_modals(max_attempts: int = 5) -> int:
@@ -89,46 +112,60 @@ def dismiss_all_modals(max_attempts: int = 5) -> int:
     handler = get_modal_handler()
     user = get_user()
     
+    # Use non-blocking modal detection
+    if not handler.detect_modal_dialog():
+        return 0
+    
+    # Escape every alert-like window at once, then fall back to dismissing
+    # whatever is still in front one at a time
     dismissed = 0
-    for i in range(max_attempts):
-        # Use non-blocking modal detection
-        modal = handler.detect_modal_dialog()
-        if not modal:
+    if handler.dismiss_all_in_one_shot():
+        dismissed += 1
+    while dismissed < max_attempts:
+        if wait_for_no_modals(timeout=0.5):
             break
-        
-        # Try to dismiss
-        if handler.dismiss_focus_stealer():
-            dismissed += 1
-        else:
+        if not handler.dismiss_focus_stealer():
             # Just press escape as fallback
             user.press_escape()
-            time.sleep(0.15)
-            dismissed += 1
+        dismissed += 1
     
     return dismissed
 
 
+# Casefolded title fragments of the windows close_utility_windows() closes
+_CLOSE_TARGETS = tuple(t.casefold() for t in (
+    'Info', 'Finder', 'Workspace Preferences', 'Run', 'Open With', 'Go to Folder'
+))
+
+
+def _utility_windows(windows: List["WindowInfo"]) -> List["WindowInfo"]:
+    """The windows close_utility_windows() would close."""
+    return [w for w in windows
+            if any(t in w.name.casefold() for t in _CLOSE_TARGETS)]
+
+
+def _close_windows(windows: List["WindowInfo"]):
+    """Focus and Cmd+W each window, waiting for it to go."""
+    user = get_user()
+    client = get_client()
+    
+    for window in windows:
+        try:
+            user.focus_window_by_name(window.name)
+            _settle()
+            user.cmd('w')
+            _settle(lambda: not client.window_exists(window.name))
+        except Exception as e:
+            # Best effort: keep closing the rest
+            print(f"  Could not close {window.name!r}: {type(e).__name__}: {e}")
+
+
 def close_utility_windows():
     """Close common utility windows (Info, Finder, Preferences, etc.)."""
-    user = get_user()
     handler = get_modal_handler()
     
-    windows_to_close = ['Info', 'Finder', 'Workspace Preferences', 'Run', 
-                        'Open With', 'Go to Folder']
-    
     # Use xdotool to check for windows (non-blocking)
-    all_windows = handler.get_all_visible_windows()
-    for window in all_windows:
-        for title in windows_to_close:
-            if title.lower() in window.name.lower():
-                try:
-                    user.focus_window_by_name(window.name)
-                    time.sleep(0.2)
-                    user.cmd('w')
-                    time.sleep(0.3)
-                except:
-                    pass
-                break
+    _close_windows(_utility_windows(handler.get_all_visible_windows()))
 
 
 def ensure_clean_state():
@@ -139,11 +176,29 @@ def ensure_clean_state():
     - Dismiss any modal dialogs
     - Close utility windows
     - Focus Workspace
+    
+    One window listing serves all three checks, so an already clean UI
+    costs no dismissal, close or refocus.
     """
-    dismiss_all_modals()
-    close_utility_windows()
-    activate_workspace()
-    time.sleep(0.3)
+    handler = get_modal_handler()
+    
+    windows = handler.get_all_visible_windows()
+    active_id = handler.get_active_window_id()
+    focused = next((w for w in windows if w.window_id == active_id), None)
+    
+    if focused is not None and handler.detect_modal_dialog(focused):
+        dismiss_all_modals()
+        # Dismissing can close windows and move focus
+        windows = handler.get_all_visible_windows()
+        focused = None
+    
+    utilities = _utility_windows(windows)
+    if utilities:
+        _close_windows(utilities)
+        focused = None
+    
+    if focused is None or not handler.is_normal_workspace_window(focused):
+        activate_workspace()
 
 
 def ensure_viewer_window() -> bool:
@@ -154,15 +209,11 @@ def ensure_viewer_window() -> bool:
         True if viewer is available
     """
     user = get_user()
-    client = get_client()
-    
-    visible = client.get_visible_windows()
-    has_viewer = any(w.get('class') == 'GWViewerWindow' for w in visible)
     
-    if not has_viewer:
+    if count_viewer_windows() == 0:
         activate_workspace()
         user.cmd('n')  # Open new viewer
-        time.sleep(0.5)
+        wait_for_viewer_count(1)
     
     return True
 
@@ -175,23 +226,35 @@ def close_extra_viewers(keep: int = 1):
         keep: Number of viewer windows to keep open
     """
     user = get_user()
-    client = get_client()
-    
-    visible = client.get_visible_windows()
-    viewers = [w for w in visible if w.get('class') == 'GWViewerWindow']
     
-    while len(viewers) > keep:
+    # Each Cmd+W closes one viewer, so count down instead of refetching
+    count = count_viewer_windows()
+    while count > keep:
         user.cmd('w')
-        time.sleep(0.3)
-        visible = client.get_visible_windows()
-        viewers = [w for w in visible if w.get('class') == 'GWViewerWindow']
+        if not wait_for_viewer_count(count - 1):
+            break  # Cmd+W went to a non-viewer window
+        count -= 1
+
+
+# Every window in query-ui output carries its class name
+_window_class = itemgetter('class')
+VIEWER_CLASS = 'GWViewerWindow'
 
 
 def count_viewer_windows() -> int:
     """Count open viewer windows."""
-    client = get_client()
-    visible = client.get_visible_windows()
-    return sum(1 for w in visible if w.get('class') == 'GWViewerWindow')
+    visible = get_client().get_visible_windows()
+    return sum(cls == VIEWER_CLASS for cls in map(_window_class, visible))
+
+
+def wait_for_viewer_count(count: int, timeout: float = 3.0, interval: float = 0.05) -> bool:
+    """
+    Wait until exactly count viewer windows are open.
+    
+    Returns:
+        True if the count was reached before the timeout
+    """
+    return wait_until(lambda: count_viewer_windows() == count, timeout, interval)
 
 
 def close_window_by_title(title: str) -> bool:
@@ -209,10 +272,9 @@ def close_window_by_title(title: str) -> bool:
     
     try:
         user.focus_window_by_name(title)
-        time.sleep(0.2)
+        _settle()
         user.cmd('w')
-        time.sleep(0.3)
-        return not client.window_exists(title)
+        return _settle(lambda: not client.window_exists(title))
     except:
         return False
 
@@ -221,6 +283,10 @@ def wait_for_window(title: str, timeout: float = 5.0) -> bool:
     """
     Wait for a window to appear.
     
+    Workspace does the waiting (wait-window) and answers as soon as the
+    window is on screen. This beats xdotool search --sync, which re-runs
+    its search every half second and matches windows of any application.
+    
     Args:
         title: Window title to wait for
         timeout: Maximum seconds to wait
@@ -228,14 +294,7 @@ def wait_for_window(title: str, timeout: float = 5.0) -> bool:
     Returns:
         True if window appeared
     """
-    client = get_client()
-    
-    start = time.time()
-    while time.time() - start < timeout:
-        if client.window_exists(title):
-            return True
-        time.sleep(0.2)
-    return False
+    return get_client().wait_for_window_open(title, timeout)
 
 
 def wait_for_no_modals(timeout: float = 3.0) -> bool:
@@ -247,13 +306,7 @@ def wait_for_no_modals(timeout: float = 3.0) -> bool:
         True if no modals remain
     """
     handler = get_modal_handler()
-    
-    start = time.time()
-    while time.time() - start < timeout:
-        if not handler.detect_modal_dialog():
-            return True
-        time.sleep(0.2)
-    return False
+    return wait_until(lambda: not handler.detect_modal_dialog(), timeout, 0.05)
 
 
 # Screen dimensions (can be overridden)
@@ -261,18 +314,66 @@ SCREEN_WIDTH = 1920
 SCREEN_HEIGHT = 1080
 MENU_BAR_Y = 11
 
-# Menu bar X positions
-MENU_POSITIONS = {
-    'Workspace': 60,
-    'File': 150,
-    'Edit': 220,
-    'View': 280,
-    'Go': 330,
-    'Tools': 390,
-    'Window': 470,
-    'Help': 540
+
+@dataclass(frozen=True)
+class MenuXY:
+    """Click point of a menu bar title."""
+    x: int
+    y: int = MENU_BAR_Y
+
+
+class Menus:
+    """Menu bar titles, measured from Workspace."""
+    workspace = MenuXY(60)
+    file = MenuXY(150)
+    edit = MenuXY(220)
+    view = MenuXY(280)
+    go = MenuXY(330)
+    tools = MenuXY(390)
+    window = MenuXY(470)
+    help = MenuXY(540)
+
+
+# Menu bar titles as shown, for callers that still pass names
+MENU_BY_NAME = {
+    'Workspace': Menus.workspace,
+    'File': Menus.file,
+    'Edit': Menus.edit,
+    'View': Menus.view,
+    'Go': Menus.go,
+    'Tools': Menus.tools,
+    'Window': Menus.window,
+    'Help': Menus.help,
 }
 
+# Menu bar X positions by title
+MENU_POSITIONS = {name: menu.x for name, menu in MENU_BY_NAME.items()}
+
+_UNKNOWN_MENU = MenuXY(100)
+
+
+def center_of(window: Dict[str, Any], dx: int = 0, dy: int = 0) -> Tuple[int, int]:
+    """
+    Get the screen point at the center of a window, for xdotool.
+    
+    Window frames are in AppKit screen coordinates (origin bottom-left)
+    while xdotool uses X11 coordinates (origin top-left), so y is flipped
+    against the real display height.
+    
+    Args:
+        window: Window dictionary from the UI state (needs 'frame')
+        dx: Horizontal offset from the center, rightwards
+        dy: Vertical offset from the center, downwards
+        
+    Returns:
+        Tuple of (x, y) screen coordinates
+    """
+    frame = window['frame']
+    _, screen_height = get_client().screen_size()
+    x = frame['x'] + frame['width'] / 2 + dx
+    y = screen_height - (frame['y'] + frame['height'] / 2) + dy
+    return int(x), int(y)
+
 
 def safe_click(x: int, y: int, smooth: bool = True, check_focus: bool = True) -> Dict[str, Any]:
     """
@@ -295,7 +396,7 @@ def safe_click(x: int, y: int, smooth: bool = True, check_focus: bool = True) ->
     
     if check_focus:
         # Check for modals/focus stealers BEFORE clicking
-        check = handler.pre_click_check()
+        check = handler.pre_click_check_cached()
         if check['modal_detected']:
             result['modal_dismissed'] = True
             result['details'].append(f"Dismissed modal: {check['modal_detected']}")
@@ -312,33 +413,34 @@ def safe_click(x: int, y: int, smooth: bool = True, check_focus: bool = True) ->
     return result
 
 
-def safe_click_menu(menu_name: str, smooth: bool = True) -> Dict[str, Any]:
+def safe_click_menu(menu: Union[str, MenuXY], smooth: bool = True) -> Dict[str, Any]:
     """
     Click on a menu in the menu bar with pre-click focus check.
     
     Args:
-        menu_name: Name of menu to click
+        menu: Menus attribute, or menu title as shown in the bar
         smooth: Use smooth mouse movement
         
     Returns:
         Dictionary with click result
     """
-    x = MENU_POSITIONS.get(menu_name, 100)
-    result = safe_click(x, MENU_BAR_Y, smooth=smooth)
-    time.sleep(0.3)
+    if isinstance(menu, str):
+        menu = MENU_BY_NAME.get(menu, _UNKNOWN_MENU)
+    result = safe_click(menu.x, menu.y, smooth=smooth)
+    _settle()
     return result
 
 
-def click_menu(menu_name: str, smooth: bool = True):
+def click_menu(menu: Union[str, MenuXY], smooth: bool = True):
     """Click on a menu in the menu bar (with focus check)."""
-    safe_click_menu(menu_name, smooth)
+    safe_click_menu(menu, smooth)
 
 
 def dismiss_menu():
     """Dismiss any open menu by pressing Escape."""
     user = get_user()
     user.press_escape()
-    time.sleep(0.2)
+    _settle()
 
 
 class TestContext:
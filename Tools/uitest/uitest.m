@@ -41,6 +41,11 @@
 - (NSDictionary *)waitForWindow:(NSString *)title timeout:(NSTimeInterval)timeout;
 - (NSDictionary *)closeWindow:(NSString *)title;
 - (NSDictionary *)findElementInWindow:(NSString *)window withText:(NSString *)elementText;
+- (NSDictionary *)setTextFieldInWindow:(NSString *)window value:(NSString *)value;
+- (NSDictionary *)closeWindowsOfClass:(NSString *)className limit:(NSInteger)limit;
+- (NSDictionary *)buildInfo;
+- (NSDictionary *)keyWindowInfo;
+- (NSDictionary *)labeledFieldsInWindow:(NSString *)window;
 @end
 
 typedef enum {
@@ -60,7 +65,13 @@ typedef enum {
   TestActionWaitWindow,
   TestActionCloseWindow,
   TestActionFindElement,
-  TestActionListMenus
+  TestActionListMenus,
+  TestActionSetText,
+  TestActionCloseClass,
+  TestActionBuildInfo,
+  TestActionKeyWindow,
+  TestActionScreenSize,
+  TestActionFields
 } TestAction;
 
 /* Forward declarations */
@@ -81,6 +92,8 @@ void printUsage(const char *programName) {
   fprintf(stderr, "  query [options]      Query UI state in various formats\n");
   fprintf(stderr, "                       --json (default) | --tree | --text\n");
   fprintf(stderr, "  list-menus           List all menus and items with enabled/disabled state\n");
+  fprintf(stderr, "  build-info           Show the running Workspace release and executable details\n");
+  fprintf(stderr, "  screen-size          Show the X display size in pixels\n");
   fprintf(stderr, "  run-script PATH      Run Python test script against Workspace\n");
   fprintf(stderr, "\n");
   fprintf(stderr, "UI Interaction Commands:\n");
@@ -89,7 +102,11 @@ void printUsage(const char *programName) {
   fprintf(stderr, "  shortcut \"Keys\"      Send keyboard shortcut (e.g., \"Cmd+i\")\n");
   fprintf(stderr, "  wait-window \"Title\" [timeout]  Wait for window to appear (default 5s)\n");
   fprintf(stderr, "  close-window \"Title\" Close a window by title\n");
+  fprintf(stderr, "  key-window           Show the title and class of Workspace's key window\n");
+  fprintf(stderr, "  close-class \"Class\" [count]  Close visible windows of a class (default 1, 0 = all)\n");
   fprintf(stderr, "  find \"Window\" \"Text\" Find element with text in window\n");
+  fprintf(stderr, "  fields \"Window\"      List \"Label:\" -> value pairs of a form window (e.g. Info)\n");
+  fprintf(stderr, "  set-text \"Window\" \"Text\"  Set the editable text field in window and fire its action\n");
   fprintf(stderr, "\n");
   fprintf(stderr, "Failure Highlighting:\n");
   fprintf(stderr, "  highlight \"Window\" \"Text\" [duration]  Highlight element with red overlay\n");
@@ -1066,6 +1083,98 @@ int doCloseWindow(const char *windowTitle) {
   return result;
 }
 
+int doKeyWindow(void) {
+  NSAutoreleasePool *pool = [NSAutoreleasePool new];
+  int result = 0;
+  
+  @try {
+    id proxy = getWorkspaceProxy();
+    if (!proxy) {
+      [pool release];
+      return 1;
+    }
+    
+    if ([proxy respondsToSelector:@selector(keyWindowInfo)]) {
+      NSDictionary *response = [proxy keyWindowInfo];
+      printResultAsJSON(response);
+      if (![[response objectForKey:@"success"] boolValue]) {
+        result = 1;
+      }
+    } else {
+      fprintf(stderr, "Error: Workspace doesn't support key-window command.\n");
+      result = 1;
+    }
+  } @catch (NSException *e) {
+    fprintf(stderr, "Error: %s\n", [[e reason] UTF8String]);
+    result = 1;
+  }
+  
+  [pool release];
+  return result;
+}
+
+int doBuildInfo(void) {
+  NSAutoreleasePool *pool = [NSAutoreleasePool new];
+  int result = 0;
+  
+  @try {
+    id proxy = getWorkspaceProxy();
+    if (!proxy) {
+      [pool release];
+      return 1;
+    }
+    
+    if ([proxy respondsToSelector:@selector(buildInfo)]) {
+      NSDictionary *response = [proxy buildInfo];
+      printResultAsJSON(response);
+      if (![[response objectForKey:@"success"] boolValue]) {
+        result = 1;
+      }
+    } else {
+      fprintf(stderr, "Error: Workspace doesn't support build-info command.\n");
+      result = 1;
+    }
+  } @catch (NSException *e) {
+    fprintf(stderr, "Error: %s\n", [[e reason] UTF8String]);
+    result = 1;
+  }
+  
+  [pool release];
+  return result;
+}
+
+int doCloseClass(const char *windowClass, int limit) {
+  NSAutoreleasePool *pool = [NSAutoreleasePool new];
+  int result = 0;
+  
+  @try {
+    id proxy = getWorkspaceProxy();
+    if (!proxy) {
+      [pool release];
+      return 1;
+    }
+    
+    NSString *className = [NSString stringWithUTF8String:windowClass];
+    
+    if ([proxy respondsToSelector:@selector(closeWindowsOfClass:limit:)]) {
+      NSDictionary *response = [proxy closeWindowsOfClass:className limit:limit];
+      printResultAsJSON(response);
+      if (![[response objectForKey:@"success"] boolValue]) {
+        result = 1;
+      }
+    } else {
+      fprintf(stderr, "Error: Workspace doesn't support close-class command.\n");
+      result = 1;
+    }
+  } @catch (NSException *e) {
+    fprintf(stderr, "Error: %s\n", [[e reason] UTF8String]);
+    result = 1;
+  }
+  
+  [pool release];
+  return result;
+}
+
 int doFindElement(const char *windowTitle, const char *text) {
   NSAutoreleasePool *pool = [NSAutoreleasePool new];
   int result = 0;
@@ -1099,6 +1208,87 @@ int doFindElement(const char *windowTitle, const char *text) {
   return result;
 }
 
+int doFields(const char *windowTitle) {
+  NSAutoreleasePool *pool = [NSAutoreleasePool new];
+  int result = 0;
+  
+  @try {
+    id proxy = getWorkspaceProxy();
+    if (!proxy) {
+      [pool release];
+      return 1;
+    }
+    
+    NSString *window = [NSString stringWithUTF8String:windowTitle];
+    
+    if ([proxy respondsToSelector:@selector(labeledFieldsInWindow:)]) {
+      NSDictionary *response = [proxy labeledFieldsInWindow:window];
+      printResultAsJSON(response);
+      if (![[response objectForKey:@"success"] boolValue]) {
+        result = 1;
+      }
+    } else {
+      fprintf(stderr, "Error: Workspace doesn't support fields command.\n");
+      result = 1;
+    }
+  } @catch (NSException *e) {
+    fprintf(stderr, "Error: %s\n", [[e reason] UTF8String]);
+    result = 1;
+  }
+  
+  [pool release];
+  return result;
+}
+
+int doSetText(const char *windowTitle, const char *text) {
+  NSAutoreleasePool *pool = [NSAutoreleasePool new];
+  int result = 0;
+  
+  @try {
+    id proxy = getWorkspaceProxy();
+    if (!proxy) {
+      [pool release];
+      return 1;
+    }
+    
+    NSString *window = [NSString stringWithUTF8String:windowTitle];
+    NSString *value = [NSString stringWithUTF8String:text];
+    
+    if ([proxy respondsToSelector:@selector(setTextFieldInWindow:value:)]) {
+      NSDictionary *response = [proxy setTextFieldInWindow:window value:value];
+      printResultAsJSON(response);
+      if (![[response objectForKey:@"success"] boolValue]) {
+        result = 1;
+      }
+    } else {
+      fprintf(stderr, "Error: Workspace doesn't support set-text command.\n");
+      result = 1;
+    }
+  } @catch (NSException *e) {
+    fprintf(stderr, "Error: %s\n", [[e reason] UTF8String]);
+    result = 1;
+  }
+  
+  [pool release];
+  return result;
+}
+
+/* Report the default X screen size; does not need Workspace */
+int doScreenSize(void) {
+  Display *display = XOpenDisplay(NULL);
+  if (!display) {
+    fprintf(stderr, "Error: Cannot open X display\n");
+    return 1;
+  }
+  
+  int screen = DefaultScreen(display);
+  fprintf(stdout, "{\n  \"success\" : true,\n  \"width\" : %d,\n  \"height\" : %d\n}\n",
+          DisplayWidth(display, screen), DisplayHeight(display, screen));
+  
+  XCloseDisplay(display);
+  return 0;
+}
+
 /* Interactive point selection using X11 */
 int selectPointInteractive(CGFloat *x, CGFloat *y) {
   Display *display = XOpenDisplay(NULL);
@@ -1195,10 +1385,22 @@ int main(int argc, char** argv) {
       action = TestActionWaitWindow;
     } else if ([command isEqualToString:@"close-window"]) {
       action = TestActionCloseWindow;
+    } else if ([command isEqualToString:@"close-class"]) {
+      action = TestActionCloseClass;
     } else if ([command isEqualToString:@"find"]) {
       action = TestActionFindElement;
     } else if ([command isEqualToString:@"list-menus"]) {
       action = TestActionListMenus;
+    } else if ([command isEqualToString:@"screen-size"]) {
+      action = TestActionScreenSize;
+    } else if ([command isEqualToString:@"key-window"]) {
+      action = TestActionKeyWindow;
+    } else if ([command isEqualToString:@"build-info"]) {
+      action = TestActionBuildInfo;
+    } else if ([command isEqualToString:@"fields"]) {
+      action = TestActionFields;
+    } else if ([command isEqualToString:@"set-text"]) {
+      action = TestActionSetText;
     } else if ([command isEqualToString:@"help"] || 
                [command isEqualToString:@"--help"] ||
                [command isEqualToString:@"-h"]) {
@@ -1332,6 +1534,17 @@ int main(int argc, char** argv) {
       }
       break;
       
+    case TestActionCloseClass:
+      if (argc < 3) {
+        fprintf(stderr, "Error: close-class requires a window class name.\n");
+        fprintf(stderr, "Usage: %s close-class \"Class\" [count]\n", argv[0]);
+        result = 1;
+      } else {
+        int limit = (argc > 3) ? atoi(argv[3]) : 1;
+        result = doCloseClass(argv[2], limit);
+      }
+      break;
+      
     case TestActionFindElement:
       if (argc < 4) {
         fprintf(stderr, "Error: find requires window title and text.\n");
@@ -1346,6 +1559,38 @@ int main(int argc, char** argv) {
       result = doListMenus();
       break;
       
+    case TestActionScreenSize:
+      result = doScreenSize();
+      break;
+      
+    case TestActionKeyWindow:
+      result = doKeyWindow();
+      break;
+      
+    case TestActionBuildInfo:
+      result = doBuildInfo();
+      break;
+      
+    case TestActionFields:
+      if (argc < 3) {
+        fprintf(stderr, "Error: fields requires window title.\n");
+        fprintf(stderr, "Usage: %s fields \"Window\"\n", argv[0]);
+        result = 1;
+      } else {
+        result = doFields(argv[2]);
+      }
+      break;
+      
+    case TestActionSetText:
+      if (argc < 4) {
+        fprintf(stderr, "Error: set-text requires window title and text.\n");
+        fprintf(stderr, "Usage: %s set-text \"Window\" \"Text\"\n", argv[0]);
+        result = 1;
+      } else {
+        result = doSetText(argv[2], argv[3]);
+      }
+      break;
+      
     case TestActionShowHelp:
       printUsage(argv[0]);
       result = 0;
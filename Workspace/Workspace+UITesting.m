@@ -24,6 +24,7 @@
 #import <unistd.h>
 #import <pthread.h>
 #import <errno.h>
+#import <math.h>
 #import "Workspace.h"
 #import "WorkspaceUITesting.h"
 
@@ -229,6 +230,8 @@ static NSMutableDictionary* _buildViewDict(NSView *view);
 static NSMutableDictionary* _buildWindowDict(NSWindow *window);
 static NSView* _findViewWithText(NSView *view, NSString *text);
 static NSWindow* _findWindowWithTitle(NSString *title);
+static NSTextField* _findEditableTextField(NSView *view);
+static void _collectLabeledFields(NSView *view, NSMutableDictionary *fields);
 
 /**
  * Public function to enable/disable UI testing
@@ -276,6 +279,117 @@ static NSWindow* _findWindowWithTitle(NSString *title)
   return nil;
 }
 
+/**
+ * Helper: Find the first editable text field in a view hierarchy
+ */
+static NSTextField* _findEditableTextField(NSView *view)
+{
+  if ([view isKindOfClass:[NSTextField class]]
+      && [(NSTextField *)view isEditable]
+      && [(NSTextField *)view isEnabled]
+      && ![view isHiddenOrHasHiddenAncestor]) {
+    return (NSTextField *)view;
+  }
+  
+  for (NSView *subview in [view subviews]) {
+    NSTextField *found = _findEditableTextField(subview);
+    if (found) {
+      return found;
+    }
+  }
+  
+  return nil;
+}
+
+/**
+ * Helper: Join the text of all text fields below a view
+ */
+static NSString* _joinedFieldText(NSView *view)
+{
+  NSMutableArray *parts = [NSMutableArray array];
+  
+  for (NSView *subview in [view subviews]) {
+    if ([subview isKindOfClass:[NSTextField class]]) {
+      NSString *text = [(NSTextField *)subview stringValue];
+      if ([text length]) {
+        [parts addObject:text];
+      }
+    } else {
+      NSString *text = _joinedFieldText(subview);
+      if ([text length]) {
+        [parts addObject:text];
+      }
+    }
+  }
+  
+  return [parts componentsJoinedByString:@" "];
+}
+
+/**
+ * Helper: Collect "Label:" -> value pairs from a form-like view hierarchy.
+ * The value is the nearest text field to the right of the label on the
+ * same row. Titled boxes map their title to the text they contain.
+ */
+static void _collectLabeledFields(NSView *view, NSMutableDictionary *fields)
+{
+  NSArray *subviews = [view subviews];
+  
+  for (NSView *label in subviews) {
+    if (![label isKindOfClass:[NSTextField class]]
+        || [label isHiddenOrHasHiddenAncestor]) {
+      continue;
+    }
+    
+    NSString *text = [(NSTextField *)label stringValue];
+    if ([text length] < 2 || ![text hasSuffix:@":"]) {
+      continue;
+    }
+    
+    NSRect labelFrame = [label frame];
+    NSTextField *value = nil;
+    CGFloat bestDistance = 0;
+    
+    for (NSView *candidate in subviews) {
+      if (candidate == label
+          || ![candidate isKindOfClass:[NSTextField class]]
+          || [candidate isHiddenOrHasHiddenAncestor]) {
+        continue;
+      }
+      
+      NSRect frame = [candidate frame];
+      CGFloat distance = NSMinX(frame) - NSMaxX(labelFrame);
+      
+      /* Same row, to the right of the label */
+      if (distance < -2.0
+          || fabs(NSMidY(frame) - NSMidY(labelFrame)) > NSHeight(labelFrame) / 2) {
+        continue;
+      }
+      if (value == nil || distance < bestDistance) {
+        value = (NSTextField *)candidate;
+        bestDistance = distance;
+      }
+    }
+    
+    if (value) {
+      [fields setObject:[value stringValue]
+                 forKey:[text substringToIndex:[text length] - 1]];
+    }
+  }
+  
+  for (NSView *subview in subviews) {
+    if ([subview isHiddenOrHasHiddenAncestor]) {
+      continue;
+    }
+    if ([subview isKindOfClass:[NSBox class]]
+        && [[(NSBox *)subview title] length]
+        && [fields objectForKey:[(NSBox *)subview title]] == nil) {
+      [fields setObject:_joinedFieldText([(NSBox *)subview contentView])
+                 forKey:[(NSBox *)subview title]];
+    }
+    _collectLabeledFields(subview, fields);
+  }
+}
+
 /**
  * Helper: Find a view containing specific text
  */
@@ -1217,6 +1331,221 @@ static NSMutableDictionary* _buildWindowDict(NSWindow *window)
   }
 }
 
+/**
+ * Read a form-like window (e.g. the Info inspector) as label -> value pairs
+ */
+- (NSDictionary *)labeledFieldsInWindow:(NSString *)windowTitle
+{
+  if (!isUITestingEnabled()) {
+    return @{@"success": @NO, @"error": @"UI Testing disabled"};
+  }
+  
+  @try {
+    NSWindow *window = _findWindowWithTitle(windowTitle);
+    if (!window) {
+      return @{@"success": @NO, @"error": @"Window not found"};
+    }
+    
+    NSMutableDictionary *fields = [NSMutableDictionary dictionary];
+    _collectLabeledFields([window contentView], fields);
+    
+    return @{
+      @"success": @YES,
+      @"window": [window title],
+      @"fields": fields
+    };
+    
+  } @catch (NSException *e) {
+    return @{@"success": @NO, @"error": [e reason]};
+  }
+}
+
+/**
+ * Describe the key window, if Workspace is the active application
+ */
+- (NSDictionary *)keyWindowInfo
+{
+  if (!isUITestingEnabled()) {
+    return @{@"success": @NO, @"error": @"UI Testing disabled"};
+  }
+  
+  @try {
+    NSApplication *app = [NSApplication sharedApplication];
+    NSWindow *keyWindow = [app keyWindow];
+    NSMutableDictionary *result = [NSMutableDictionary dictionary];
+    
+    [result setObject:@YES forKey:@"success"];
+    [result setObject:([app isActive] ? @YES : @NO) forKey:@"active"];
+    
+    if ([app isActive] && keyWindow) {
+      [result setObject:([keyWindow title] ? [keyWindow title] : @"") forKey:@"title"];
+      [result setObject:NSStringFromClass([keyWindow class]) forKey:@"class"];
+    }
+    
+    return result;
+    
+  } @catch (NSException *e) {
+    return @{@"success": @NO, @"error": [e reason]};
+  }
+}
+
+/**
+ * Identify the running Workspace build: release from the Info.plist plus
+ * the executable's path, size and modification time
+ */
+- (NSDictionary *)buildInfo
+{
+  if (!isUITestingEnabled()) {
+    return @{@"success": @NO, @"error": @"UI Testing disabled"};
+  }
+  
+  @try {
+    NSBundle *bundle = [NSBundle mainBundle];
+    NSDictionary *info = [bundle infoDictionary];
+    NSString *executable = [bundle executablePath];
+    NSMutableDictionary *result = [NSMutableDictionary dictionary];
+    id value;
+    
+    [result setObject:@YES forKey:@"success"];
+    
+    if ((value = [info objectForKey:@"ApplicationRelease"]) != nil) {
+      [result setObject:value forKey:@"release"];
+    }
+    if ((value = [info objectForKey:@"CFBundleVersion"]) != nil) {
+      [result setObject:value forKey:@"version"];
+    }
+    
+    if (executable) {
+      NSDictionary *attributes = [[NSFileManager defaultManager]
+                                   fileAttributesAtPath:executable
+                                           traverseLink:YES];
+      
+      [result setObject:executable forKey:@"executable"];
+      if (attributes) {
+        [result setObject:[NSNumber numberWithUnsignedLongLong:[attributes fileSize]]
+                   forKey:@"size"];
+        [result setObject:[NSNumber numberWithDouble:
+                             [[attributes fileModificationDate] timeIntervalSince1970]]
+                   forKey:@"modified"];
+      }
+    }
+    
+    return result;
+    
+  } @catch (NSException *e) {
+    return @{@"success": @NO, @"error": [e reason]};
+  }
+}
+
+/**
+ * Close visible windows of a given class via -performClose:.
+ * The key window is closed first, then the others front to back.
+ * A limit of 0 closes every matching window; no match is not an error.
+ */
+- (NSDictionary *)closeWindowsOfClass:(NSString *)className limit:(NSInteger)limit
+{
+  if (!isUITestingEnabled()) {
+    return @{@"success": @NO, @"error": @"UI Testing disabled"};
+  }
+  
+  @try {
+    Class windowClass = NSClassFromString(className);
+    if (!windowClass) {
+      return @{@"success": @NO, @"error": @"Unknown window class"};
+    }
+    
+    NSApplication *app = [NSApplication sharedApplication];
+    NSMutableArray *candidates = [NSMutableArray array];
+    NSWindow *keyWindow = [app keyWindow];
+    
+    if (keyWindow && [keyWindow isKindOfClass:windowClass]) {
+      [candidates addObject:keyWindow];
+    }
+    for (NSWindow *window in [app orderedWindows]) {
+      if ([window isKindOfClass:windowClass]
+          && [window isVisible]
+          && ![candidates containsObject:window]) {
+        [candidates addObject:window];
+      }
+    }
+    
+    NSMutableArray *closed = [NSMutableArray array];
+    for (NSWindow *window in candidates) {
+      if (limit > 0 && (NSInteger)[closed count] >= limit) {
+        break;
+      }
+      NSString *title = [window title];
+      [window performClose:self];
+      [closed addObject:(title ? title : @"")];
+    }
+    
+    return @{
+      @"success": @YES,
+      @"closed": closed,
+      @"count": [NSNumber numberWithUnsignedInteger:[closed count]]
+    };
+    
+  } @catch (NSException *e) {
+    return @{@"success": @NO, @"error": [e reason]};
+  }
+}
+
+/**
+ * Set the text of an editable field in a window and fire its action.
+ * Uses the field being edited if there is one, otherwise the first
+ * editable text field in the window.
+ */
+- (NSDictionary *)setTextFieldInWindow:(NSString *)windowTitle value:(NSString *)value
+{
+  if (!isUITestingEnabled()) {
+    return @{@"success": @NO, @"error": @"UI Testing disabled"};
+  }
+  
+  @try {
+    NSWindow *window = _findWindowWithTitle(windowTitle);
+    if (!window) {
+      return @{@"success": @NO, @"error": @"Window not found"};
+    }
+    
+    NSTextField *field = nil;
+    id responder = [window firstResponder];
+    
+    /* While a field is being edited the field editor is first responder */
+    if ([responder isKindOfClass:[NSTextView class]]
+        && [[responder delegate] isKindOfClass:[NSTextField class]]) {
+      field = (NSTextField *)[responder delegate];
+    } else if ([responder isKindOfClass:[NSTextField class]]
+               && [responder isEditable]) {
+      field = responder;
+    } else {
+      field = _findEditableTextField([window contentView]);
+    }
+    
+    if (!field) {
+      return @{@"success": @NO, @"error": @"No editable text field in window"};
+    }
+    
+    if ([field currentEditor]) {
+      [field abortEditing];
+    }
+    [field setStringValue:(value ? value : @"")];
+    
+    if ([field action]) {
+      [field sendAction:[field action] to:[field target]];
+    }
+    
+    return @{
+      @"success": @YES,
+      @"window": [window title],
+      @"class": NSStringFromClass([field class]),
+      @"value": [field stringValue]
+    };
+    
+  } @catch (NSException *e) {
+    return @{@"success": @NO, @"error": [e reason]};
+  }
+}
+
 /**
  * Get all menus and menu items with their enabled/disabled state
  * Returns a JSON string for distributed objects compatibility